@@ -0,0 +1,62 @@
+"""Hot-path indexes, built online
+
+Revision ID: 001645ca9c91
+Revises: 83e26d99abc4
+Create Date: 2026-10-17 10:15:00.000000
+
+Every index is built with CREATE INDEX CONCURRENTLY, which can't run inside a
+transaction, so they run in an autocommit block: writes to orders and clients
+keep flowing while the indexes build. If a build fails it leaves an INVALID
+index behind; drop it and run the upgrade again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '001645ca9c91'
+down_revision: Union[str, Sequence[str], None] = '83e26d99abc4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match ClientORM's SEARCH_DOCUMENT exactly for queries to use the index
+CLIENT_SEARCH_DOCUMENT = (
+    "shooper_unaccent(lower(coalesce(name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+    "coalesce(email, '') || ' ' || coalesce(phone, '')))"
+)
+
+# (name, table, columns, extra create_index options)
+INDEXES = [
+    ("ix_orders_user_id_date", "orders", ["user_id", "date"], {}),
+    ("ix_orders_user_id_status_date", "orders", ["user_id", "status", "date"], {}),
+    ("ix_orders_user_id_created_at_id", "orders", ["user_id", "created_at", "id"], {}),
+    ("ix_orders_open_user_id_created_at_id", "orders", ["user_id", "created_at", "id"], {
+        "postgresql_where": sa.text("status IN ('PENDING', 'PURCHASED', 'SHIPPED')"),
+    }),
+    ("ix_orders_client_id_created_at_id", "orders", ["client_id", "created_at", "id"], {}),
+    ("ix_clients_user_id_created_at_id", "clients", ["user_id", "created_at", "id"], {}),
+    ("ix_clients_user_id_email", "clients", ["user_id", "email"], {}),
+    ("ix_clients_user_id_total_spent", "clients", ["user_id", sa.text("total_spent DESC")], {}),
+    ("ix_clients_search_trgm", "clients", [sa.text(f"{CLIENT_SEARCH_DOCUMENT} gin_trgm_ops")], {
+        "postgresql_using": "gin",
+    }),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True, **options
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,99 @@
+"""Monthly rollups, client lifetime stats and uploaded logos
+
+Revision ID: 2063db4b6343
+Revises: 5ed92e822ed4
+Create Date: 2026-10-17 10:05:00.000000
+
+Each step is skipped if create_all already applied it. Freshly added rollups and
+client stats are backfilled from the orders table here; afterwards the order
+endpoints keep them in sync (rebuild_metrics.py repairs drift).
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2063db4b6343'
+down_revision: Union[str, Sequence[str], None] = '5ed92e822ed4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ('PENDING', 'PURCHASED', 'SHIPPED', 'DELIVERED', 'CANCELLED')
+
+
+def _has_table(table: str) -> bool:
+    # Offline (--sql) scripts are for databases that are exactly at the previous revision
+    return not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table(table)
+
+def _has_column(table: str, column: str) -> bool:
+    if context.is_offline_mode():
+        return False
+    return column in {c['name'] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _has_table('monthly_metrics'):
+        op.create_table(
+            'monthly_metrics',
+            sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), primary_key=True),
+            sa.Column('year', sa.Integer(), primary_key=True),
+            sa.Column('month', sa.Integer(), primary_key=True),
+            sa.Column('total_revenue', sa.Numeric(14, 2), nullable=False),
+            sa.Column('total_profit', sa.Numeric(14, 2), nullable=False),
+            sa.Column('total_tax', sa.Numeric(14, 2), nullable=False),
+            sa.Column('total_commission', sa.Numeric(14, 2), nullable=False),
+            sa.Column('order_count', sa.Integer(), nullable=False),
+            *[sa.Column(f'{status.lower()}_count', sa.Integer(), nullable=False) for status in STATUSES],
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+        )
+        status_counts = ", ".join(f"count(id) FILTER (WHERE status = '{status}')" for status in STATUSES)
+        op.execute(f"""
+            INSERT INTO monthly_metrics (
+                user_id, year, month, total_revenue, total_profit, total_tax, total_commission,
+                order_count, {", ".join(f"{status.lower()}_count" for status in STATUSES)}, updated_at
+            )
+            SELECT user_id, extract(year FROM date)::int, extract(month FROM date)::int,
+                   coalesce(sum(total_amount), 0), coalesce(sum(total_profit), 0),
+                   coalesce(sum(total_tax), 0), coalesce(sum(total_commission), 0),
+                   count(id), {status_counts}, now()
+            FROM orders
+            WHERE date IS NOT NULL
+            GROUP BY 1, 2, 3
+        """)
+
+    if not _has_column('clients', 'total_orders'):
+        op.add_column('clients', sa.Column('total_orders', sa.Integer(), nullable=False, server_default='0'))
+        op.add_column('clients', sa.Column('total_spent', sa.Numeric(14, 2), nullable=False, server_default='0'))
+        op.add_column('clients', sa.Column('last_order_at', sa.DateTime(), nullable=True))
+        op.execute("""
+            UPDATE clients
+            SET total_orders = stats.total_orders,
+                total_spent = stats.total_spent,
+                last_order_at = stats.last_order_at
+            FROM (
+                SELECT client_id, count(id) AS total_orders, sum(total_amount) AS total_spent,
+                       max(created_at) AS last_order_at
+                FROM orders
+                WHERE status <> 'CANCELLED'
+                GROUP BY client_id
+            ) AS stats
+            WHERE clients.id = stats.client_id
+        """)
+
+    if not _has_column('business_config', 'logo_hash'):
+        op.add_column('business_config', sa.Column('logo_data', sa.LargeBinary(), nullable=True))
+        op.add_column('business_config', sa.Column('logo_hash', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('business_config', 'logo_hash')
+    op.drop_column('business_config', 'logo_data')
+    op.drop_column('clients', 'last_order_at')
+    op.drop_column('clients', 'total_spent')
+    op.drop_column('clients', 'total_orders')
+    op.drop_table('monthly_metrics')
@@ -0,0 +1,110 @@
+"""Baseline schema
+
+Revision ID: 5ed92e822ed4
+Revises: 
+Create Date: 2026-10-17 10:00:00.000000
+
+Tables as the app created them with Base.metadata.create_all before migrations
+existed. Databases created that way already have them, so this is a no-op there.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5ed92e822ed4'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ORDER_STATUS = sa.Enum('PENDING', 'PURCHASED', 'SHIPPED', 'DELIVERED', 'CANCELLED', name='orderstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Offline (--sql) scripts are for empty databases
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table('users'):
+        return
+
+    op.create_table(
+        'users',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'business_config',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False, unique=True),
+        sa.Column('business_name', sa.String(), nullable=True),
+        sa.Column('logo_url', sa.String(), nullable=True),
+        sa.Column('base_currency', sa.String(), nullable=True),
+        sa.Column('contact_email', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    op.create_table(
+        'clients',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('last_name', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=True),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('address', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_clients_user_id', 'clients', ['user_id'])
+
+    op.create_table(
+        'orders',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('client_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('clients.id'), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('status', ORDER_STATUS, nullable=False),
+        sa.Column('payment_bank', sa.String(), nullable=True),
+        sa.Column('payment_method', sa.String(), nullable=True),
+        sa.Column('date', sa.Date(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('total_tax', sa.Numeric(10, 2), nullable=True),
+        sa.Column('total_commission', sa.Numeric(10, 2), nullable=True),
+        sa.Column('total_profit', sa.Numeric(10, 2), nullable=True),
+        sa.Column('total_amount', sa.Numeric(10, 2), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_orders_client_id', 'orders', ['client_id'])
+    op.create_index('ix_orders_user_id', 'orders', ['user_id'])
+
+    op.create_table(
+        'order_items',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('order_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('orders.id'), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('base_price', sa.Numeric(10, 2), nullable=False),
+        sa.Column('tax_percent', sa.Numeric(5, 2), nullable=False),
+        sa.Column('commission_percent', sa.Numeric(5, 2), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('tax_amount', sa.Numeric(10, 2), nullable=True),
+        sa.Column('commission_amount', sa.Numeric(10, 2), nullable=True),
+        sa.Column('final_price', sa.Numeric(10, 2), nullable=True),
+        sa.Column('profit_amount', sa.Numeric(10, 2), nullable=True),
+    )
+    op.create_index('ix_order_items_order_id', 'order_items', ['order_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('order_items')
+    op.drop_table('orders')
+    op.drop_table('clients')
+    op.drop_table('business_config')
+    op.drop_table('users')
+    ORDER_STATUS.drop(op.get_bind(), checkfirst=True)
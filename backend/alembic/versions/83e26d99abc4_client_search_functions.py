@@ -0,0 +1,36 @@
+"""Extensions and function for client search
+
+Revision ID: 83e26d99abc4
+Revises: 2063db4b6343
+Create Date: 2026-10-17 10:10:00.000000
+
+pg_trgm and unaccent, plus an IMMUTABLE unaccent wrapper that the trigram
+index expression can use. Creating extensions needs a role allowed to do so.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '83e26d99abc4'
+down_revision: Union[str, Sequence[str], None] = '2063db4b6343'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute(
+        "CREATE OR REPLACE FUNCTION shooper_unaccent(text) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+        "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The extensions may be used by other schemas, so they are left installed
+    op.execute("DROP FUNCTION IF EXISTS shooper_unaccent(text)")
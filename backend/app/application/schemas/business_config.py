@@ -15,6 +15,7 @@ class BusinessConfigUpdate(BusinessConfigBase):
 class BusinessConfigInDBBase(BusinessConfigBase):
     id: UUID
     user_id: UUID
+    logo_hash: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
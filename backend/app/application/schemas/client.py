@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class ClientBase(BaseModel):
@@ -20,9 +20,22 @@ class ClientInDBBase(ClientBase):
     id: UUID
     user_id: UUID
     created_at: datetime
+    total_orders: int = 0
+    total_spent: float = 0.0
+    last_order_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
 class Client(ClientInDBBase):
     pass
+
+class ClientImportError(BaseModel):
+    row: int
+    detail: str
+
+class ClientImportResult(BaseModel):
+    inserted: int
+    skipped: int
+    failed: int
+    errors: List[ClientImportError] # the first failures, capped
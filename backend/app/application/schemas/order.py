@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
-from datetime import date, datetime
+from datetime import date as Date, datetime
 from typing import List, Optional
 from app.infrastructure.database.orm_models.order import OrderStatus
 
@@ -33,7 +33,7 @@ class OrderItem(OrderItemInDBBase):
 class OrderBase(BaseModel):
     payment_bank: Optional[str] = None
     payment_method: Optional[str] = None
-    date: Optional[date] = None
+    date: Optional[Date] = None
     notes: Optional[str] = None
 
 class OrderCreate(OrderBase):
@@ -62,3 +62,39 @@ class OrderInDBBase(OrderBase):
 
 class Order(OrderInDBBase):
     items: List[OrderItem] = []
+
+# Lightweight list row for table views (no items)
+class OrderSummary(BaseModel):
+    id: UUID
+    client_id: UUID
+    status: OrderStatus
+    date: Optional[Date]
+    payment_method: Optional[str] = None
+    total_amount: float
+    total_profit: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class OrderCount(BaseModel):
+    count: int
+    exact: bool # false when counting stopped at the cap
+
+# Batch creation (import tooling)
+ORDER_BATCH_MAX_SIZE = 500
+
+class OrderBatchCreate(BaseModel):
+    orders: List[OrderCreate] = Field(..., min_length=1, max_length=ORDER_BATCH_MAX_SIZE)
+
+class OrderBatchCreated(BaseModel):
+    index: int
+    id: UUID
+
+class OrderBatchError(BaseModel):
+    index: int
+    detail: str
+
+class OrderBatchResult(BaseModel):
+    created: List[OrderBatchCreated]
+    errors: List[OrderBatchError]
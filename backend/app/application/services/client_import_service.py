@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, BinaryIO, Iterator, List, Optional, Tuple, Union
+from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.client import ClientORM
+from app.application.schemas.client import ClientCreate
+
+IMPORT_FORMATS = ("csv", "ndjson")
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+class ImportFormatError(ValueError):
+    """Raised when the upload can't be parsed as the declared format."""
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    name = (filename or "").lower()
+    if name.endswith(".csv") or content_type == "text/csv":
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")) or content_type in ("application/x-ndjson", "application/jsonl"):
+        return "ndjson"
+    return None
+
+class RowError:
+    """Stands in for the fields of a row that couldn't be parsed, so it's reported like an invalid row."""
+
+    def __init__(self, detail: str):
+        self.detail = detail
+
+def iter_rows(file: BinaryIO, fmt: str) -> Iterator[Tuple[int, Union[dict, RowError]]]:
+    """
+    Lazily yields (row number, raw fields) from an uploaded CSV (with a header row)
+    or NDJSON file, one line at a time. An NDJSON line that isn't a JSON object is
+    yielded as a RowError. Raises ImportFormatError when the file as a whole is unreadable.
+    """
+    # newline="" splits lines on \n and \r only (not U+2028 and friends, which are
+    # valid inside JSON strings and CSV fields) and leaves quoted newlines to csv
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            for fields in reader:
+                # Empty CSV cells mean "not provided"
+                yield reader.line_num, {k: (v or None) for k, v in fields.items() if k}
+        else:
+            for line_num, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    fields = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_num, RowError(f"Invalid JSON: {e}")
+                    continue
+                if not isinstance(fields, dict):
+                    yield line_num, RowError("Not a JSON object")
+                    continue
+                yield line_num, fields
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise ImportFormatError(str(e))
+    finally:
+        # Hand the upload back open; UploadFile closes it
+        text.detach()
+
+def _report_failure(summary: dict, row_num: int, detail: str) -> None:
+    summary["failed"] += 1
+    if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+        summary["errors"].append({"row": row_num, "detail": detail})
+
+async def import_clients(
+    db: AsyncSession, user_id: UUID, batches: AsyncIterator[List[Tuple[int, dict]]]
+) -> dict:
+    """
+    Validates and inserts clients batch by batch. A row whose email already belongs to
+    one of the tenant's clients, or appeared earlier in the file, is skipped; invalid
+    and unparseable rows are counted as failed and reported. Each batch costs one
+    indexed email lookup and one multi-row INSERT. The caller commits.
+    """
+    table = ClientORM.__table__
+    seen_emails = set()
+    summary = {"inserted": 0, "skipped": 0, "failed": 0, "errors": []}
+
+    async for batch in batches:
+        candidates = []
+        for row_num, fields in batch:
+            if isinstance(fields, RowError):
+                _report_failure(summary, row_num, fields.detail)
+                continue
+            try:
+                client = ClientCreate.model_validate(fields)
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                _report_failure(summary, row_num, f"{field}: {error['msg']}")
+                continue
+            if client.email is not None:
+                if client.email in seen_emails:
+                    summary["skipped"] += 1
+                    continue
+                seen_emails.add(client.email)
+            candidates.append(client)
+
+        emails = [client.email for client in candidates if client.email is not None]
+        existing = set()
+        if emails:
+            existing = set((await db.execute(select(ClientORM.email).where(
+                ClientORM.user_id == user_id,
+                ClientORM.email.in_(emails)
+            ))).scalars())
+
+        rows = [
+            {**client.model_dump(), "user_id": user_id}
+            for client in candidates
+            if client.email is None or client.email not in existing
+        ]
+        summary["skipped"] += len(candidates) - len(rows)
+        if rows:
+            await db.execute(insert(table), rows)
+            summary["inserted"] += len(rows)
+
+    return summary
@@ -0,0 +1,98 @@
+from typing import Iterable, Optional
+from uuid import UUID
+from sqlalchemy import select, update, func, values, column, Integer, Numeric, DateTime
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.client import ClientORM
+from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
+
+def _last_order_at(client_id):
+    return select(func.max(OrderORM.created_at)).where(
+        OrderORM.client_id == client_id,
+        OrderORM.status != OrderStatus.CANCELLED
+    ).scalar_subquery()
+
+async def record_orders(db: AsyncSession, orders: Iterable[OrderORM]) -> None:
+    """Counts a batch of new orders towards their clients' stats in one UPDATE ... FROM (VALUES ...)."""
+    deltas = {}
+    for order in orders:
+        if order.status == OrderStatus.CANCELLED:
+            continue
+        count, spent, last = deltas.get(order.client_id, (0, 0, order.created_at))
+        deltas[order.client_id] = (count + 1, spent + (order.total_amount or 0), max(last, order.created_at))
+    if not deltas:
+        return
+
+    delta = values(
+        column("client_id", PG_UUID(as_uuid=True)),
+        column("orders", Integer),
+        column("spent", Numeric(14, 2)),
+        column("last_order_at", DateTime),
+        name="delta"
+    ).data([(client_id, *row) for client_id, row in deltas.items()])
+    await db.execute(
+        update(ClientORM)
+        .where(ClientORM.id == delta.c.client_id)
+        .values(
+            total_orders=ClientORM.total_orders + delta.c.orders,
+            total_spent=ClientORM.total_spent + delta.c.spent,
+            last_order_at=func.greatest(ClientORM.last_order_at, delta.c.last_order_at)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+async def record_status_change(db: AsyncSession, order: OrderORM, old_status: OrderStatus) -> None:
+    """
+    Removes or re-adds an order's totals when it moves in or out of CANCELLED.
+    The caller must hold the order's row lock from reading old_status until commit,
+    or a concurrent cancellation subtracts the totals twice.
+    """
+    was_cancelled = OrderStatus(old_status) == OrderStatus.CANCELLED
+    is_cancelled = OrderStatus(order.status) == OrderStatus.CANCELLED
+    if was_cancelled == is_cancelled:
+        return
+    sign = 1 if was_cancelled else -1
+    await db.flush()  # the last_order_at subquery must see the new status
+    await db.execute(
+        update(ClientORM)
+        .where(ClientORM.id == order.client_id)
+        .values(
+            total_orders=ClientORM.total_orders + sign,
+            total_spent=ClientORM.total_spent + sign * (order.total_amount or 0),
+            last_order_at=_last_order_at(order.client_id)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+async def rebuild_client_stats(db: AsyncSession, user_id: Optional[UUID] = None) -> int:
+    """
+    Reconciles every client's lifetime stats against the orders table, for a
+    single tenant or for everyone. Returns the number of clients with orders;
+    the caller commits.
+    """
+    stats = select(
+        OrderORM.client_id,
+        func.count(OrderORM.id).label("total_orders"),
+        func.sum(OrderORM.total_amount).label("total_spent"),
+        func.max(OrderORM.created_at).label("last_order_at")
+    ).where(OrderORM.status != OrderStatus.CANCELLED).group_by(OrderORM.client_id)
+
+    reset = update(ClientORM).values(total_orders=0, total_spent=0, last_order_at=None)
+    if user_id is not None:
+        stats = stats.where(OrderORM.user_id == user_id)
+        reset = reset.where(ClientORM.user_id == user_id)
+    stats = stats.subquery()
+
+    await db.execute(reset.execution_options(synchronize_session=False))
+    result = await db.execute(
+        update(ClientORM)
+        .where(ClientORM.id == stats.c.client_id)
+        .values(
+            total_orders=stats.c.total_orders,
+            total_spent=stats.c.total_spent,
+            last_order_at=stats.c.last_order_at
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
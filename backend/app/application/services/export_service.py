@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.order import OrderORM
+from app.infrastructure.database.orm_models.order_item import OrderItemORM
+from app.infrastructure.database.orm_models.client import ClientORM
+
+EXPORT_FORMATS = ("csv", "ndjson")
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+# Rows fetched per server-side cursor round trip, and written per response chunk
+FETCH_SIZE = 1000
+
+ORDER_COLUMNS = [
+    "id", "created_at", "date", "status", "client_id", "client_name", "client_last_name",
+    "payment_method", "payment_bank", "total_tax", "total_commission", "total_profit",
+    "total_amount", "notes",
+]
+ITEM_COLUMNS = [
+    "name", "base_price", "tax_percent", "commission_percent", "quantity",
+    "tax_amount", "commission_amount", "final_price", "profit_amount",
+]
+CLIENT_COLUMNS = [
+    "id", "name", "last_name", "email", "phone", "address", "created_at",
+    "total_orders", "total_spent", "last_order_at",
+]
+
+def _item_key(name: str) -> str:
+    return f"item_{name}"
+
+def _order_select(user_id: UUID, include_items: bool):
+    columns = [
+        OrderORM.id, OrderORM.created_at, OrderORM.date, OrderORM.status, OrderORM.client_id,
+        ClientORM.name.label("client_name"), ClientORM.last_name.label("client_last_name"),
+        OrderORM.payment_method, OrderORM.payment_bank, OrderORM.total_tax,
+        OrderORM.total_commission, OrderORM.total_profit, OrderORM.total_amount, OrderORM.notes,
+    ]
+    stmt = select(*columns).join(ClientORM, ClientORM.id == OrderORM.client_id)
+    if include_items:
+        # Items are flattened onto their order's rows: one cursor, no per-order lookups
+        stmt = stmt.add_columns(
+            *[getattr(OrderItemORM, name).label(_item_key(name)) for name in ITEM_COLUMNS]
+        ).outerjoin(OrderItemORM, OrderItemORM.order_id == OrderORM.id)
+    # Oldest first, and an order's rows stay adjacent so they can be regrouped while streaming
+    return stmt.where(OrderORM.user_id == user_id).order_by(OrderORM.created_at, OrderORM.id)
+
+async def _partitions(db: AsyncSession, stmt) -> AsyncIterator[List[dict]]:
+    """Runs stmt on a server-side cursor, yielding FETCH_SIZE rows at a time as dicts."""
+    result = await db.stream(stmt.execution_options(yield_per=FETCH_SIZE))
+    async for partition in result.mappings().partitions():
+        yield partition
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "value"): # enums
+        return value.value
+    return value
+
+class _CsvChunks:
+    """Collects CSV lines in a buffer that's drained into one response chunk per fetch."""
+
+    def __init__(self, header: List[str]):
+        self._columns = header
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow(header)
+
+    def add(self, row: dict) -> None:
+        self._writer.writerow([_csv_value(row.get(name)) for name in self._columns])
+
+    def drain(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+async def stream_orders(
+    db: AsyncSession, user_id: UUID, fmt: str, include_items: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Streams a tenant's orders as CSV (one row per item when include_items) or
+    NDJSON (one order per line, with an "items" array when include_items).
+    Memory stays at one fetch batch however many orders there are.
+    """
+    stmt = _order_select(user_id, include_items)
+
+    if fmt == "csv":
+        columns = ORDER_COLUMNS + ([_item_key(name) for name in ITEM_COLUMNS] if include_items else [])
+        chunks = _CsvChunks(columns)
+        yield chunks.drain()
+        async for partition in _partitions(db, stmt):
+            for row in partition:
+                chunks.add(row)
+            yield chunks.drain()
+        return
+
+    current: Optional[dict] = None
+    async for partition in _partitions(db, stmt):
+        lines = []
+        for row in partition:
+            if not include_items:
+                lines.append(json.dumps(dict(row), default=_json_default))
+                continue
+            if current is None or current["id"] != row["id"]:
+                if current is not None:
+                    lines.append(json.dumps(current, default=_json_default))
+                current = {name: row[name] for name in ORDER_COLUMNS}
+                current["items"] = []
+            if row[_item_key("name")] is not None:
+                current["items"].append({name: row[_item_key(name)] for name in ITEM_COLUMNS})
+        if lines:
+            yield ("\n".join(lines) + "\n").encode()
+    if current is not None:
+        yield (json.dumps(current, default=_json_default) + "\n").encode()
+
+async def stream_clients(db: AsyncSession, user_id: UUID, fmt: str) -> AsyncIterator[bytes]:
+    """Streams a tenant's clients as CSV or NDJSON, oldest first."""
+    stmt = select(*[getattr(ClientORM, name) for name in CLIENT_COLUMNS]).where(
+        ClientORM.user_id == user_id
+    ).order_by(ClientORM.created_at, ClientORM.id)
+
+    if fmt == "csv":
+        chunks = _CsvChunks(CLIENT_COLUMNS)
+        yield chunks.drain()
+        async for partition in _partitions(db, stmt):
+            for row in partition:
+                chunks.add(row)
+            yield chunks.drain()
+        return
+
+    async for partition in _partitions(db, stmt):
+        yield "".join(json.dumps(dict(row), default=_json_default) + "\n" for row in partition).encode()
@@ -0,0 +1,153 @@
+import io
+import zipfile
+from datetime import date, datetime
+from typing import Iterator, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, joinedload
+
+from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
+from app.infrastructure.database.orm_models.business_config import BusinessConfigORM
+from app.application.services import pdf_service, pdf_cache, logo_service
+
+async def get_business(db: AsyncSession, user_id: UUID) -> BusinessConfigORM:
+    """Business config to print on invoices, with the logo ready for build_invoice_data."""
+    business = (await db.execute(select(BusinessConfigORM).where(
+        BusinessConfigORM.user_id == user_id
+    ))).scalars().first()
+    if not business:
+        return BusinessConfigORM(user_id=user_id, business_name="My Shopper")
+    await logo_service.load_uploaded_logo(db, business)
+    return business
+
+def build_invoice_data(order: OrderORM, business: BusinessConfigORM) -> Tuple[dict, dict, dict]:
+    """
+    Serializes an order (with items and client loaded) to the dicts the invoice template expects.
+    May download a remote logo on first use, so async callers run it in the threadpool.
+    """
+    order_data = {
+        "id": str(order.id)[:8], # short ID
+        "date": order.date.strftime("%Y-%m-%d") if order.date else "",
+        "status": order.status.value,
+        "payment_method": order.payment_method,
+        "notes": order.notes,
+        "total_tax": round(float(order.total_tax), 2),
+        "total_commission": round(float(order.total_commission), 2),
+        "total_amount": round(float(order.total_amount), 2),
+        "items": [
+            {
+                "name": item.name,
+                "quantity": item.quantity,
+                "base_price": round(float(item.base_price), 2),
+                "final_price": round(float(item.final_price), 2)
+            }
+            for item in order.items
+        ]
+    }
+
+    business_data = {
+        "business_name": business.business_name,
+        "logo_url": logo_service.logo_data_uri(business),
+        "contact_email": business.contact_email,
+        "base_currency": business.base_currency
+    }
+
+    client_data = {
+        "name": order.client.name,
+        "last_name": order.client.last_name,
+        "email": order.client.email,
+        "address": order.client.address
+    }
+    return order_data, business_data, client_data
+
+class _ZipStream(io.RawIOBase):
+    """Write-only, unseekable sink; zipfile falls back to data descriptors and we drain it after each entry."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def stream_invoices_zip(
+    db: Session,
+    user_id: UUID,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    status: Optional[OrderStatus] = None,
+    client_id: Optional[UUID] = None,
+    batch_size: int = 100
+) -> Iterator[bytes]:
+    """
+    Yields a ZIP archive of invoice PDFs for the matching orders, chunk by chunk.
+    Orders are read in batches and rendered in parallel on the PDF pool; each PDF
+    is written to the archive and flushed to the client as soon as it completes.
+    Cached PDFs are reused and fresh renders are stored in the cache.
+    Runs on a sync session in the threadpool, as a streaming response body.
+    """
+    business = db.query(BusinessConfigORM).filter(BusinessConfigORM.user_id == user_id).first()
+    if not business:
+        business = BusinessConfigORM(user_id=user_id, business_name="My Shopper")
+
+    query = db.query(OrderORM).options(
+        joinedload(OrderORM.client),
+        selectinload(OrderORM.items)
+    ).filter(OrderORM.user_id == user_id)
+    if start_date:
+        query = query.filter(OrderORM.date >= start_date)
+    if end_date:
+        query = query.filter(OrderORM.date <= end_date)
+    if status:
+        query = query.filter(OrderORM.status == status)
+    if client_id:
+        query = query.filter(OrderORM.client_id == client_id)
+    query = query.order_by(OrderORM.date, OrderORM.id).yield_per(batch_size)
+
+    sink = _ZipStream()
+    now = datetime.now().timetuple()[:6]
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for filename, pdf_bytes in _render_batches(query, business, batch_size):
+            archive.writestr(zipfile.ZipInfo(filename, date_time=now), pdf_bytes)
+            yield sink.drain()
+    yield sink.drain()
+
+def _render_batches(orders, business: BusinessConfigORM, batch_size: int) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yields (filename, pdf_bytes) per order. Cache hits are yielded directly; misses in
+    each batch are rendered in parallel and cached. Only one batch of order data is
+    held at a time, and only the renders in flight hold PDF bytes.
+    """
+    batch = []
+    for order in orders:
+        batch.append(order)
+        if len(batch) >= batch_size:
+            yield from _render_batch(batch, business)
+            batch = []
+    if batch:
+        yield from _render_batch(batch, business)
+
+def _render_batch(orders, business: BusinessConfigORM) -> Iterator[Tuple[str, bytes]]:
+    misses = []
+    for order in orders:
+        order_data, business_data, client_data = build_invoice_data(order, business)
+        key = pdf_cache.cache_key(order_data, business_data, client_data)
+        filename = f"invoice_{order.id}.pdf"
+        cached = pdf_cache.get(key)
+        if cached is not None:
+            yield filename, cached
+        else:
+            misses.append(((filename, key), order_data, business_data, client_data))
+
+    for (filename, key), pdf_bytes in pdf_service.render_many(misses):
+        pdf_cache.put(key, pdf_bytes)
+        yield filename, pdf_bytes
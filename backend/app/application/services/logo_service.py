@@ -0,0 +1,180 @@
+import base64
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.infrastructure.database.orm_models.business_config import BusinessConfigORM
+
+# Logos reach WeasyPrint as data: URIs, so rendering never opens a network connection.
+# Each logo is resolved once (memory -> disk -> database or remote host) and kept as a URI.
+_MEMORY_CACHE_SIZE = 64
+_memory_cache = OrderedDict()
+_failed_fetches = {}
+_lock = threading.Lock()
+
+def prepare_logo(raw: bytes) -> bytes:
+    """
+    Validates an uploaded or downloaded image and returns it as a PNG that fits
+    LOGO_MAX_WIDTH x LOGO_MAX_HEIGHT. Raises ValueError if it isn't a usable image.
+    """
+    from PIL import Image # only needed on upload or first remote fetch; keeps it off startup
+
+    try:
+        with Image.open(io.BytesIO(raw)) as image:
+            image.load()
+            image.thumbnail((settings.LOGO_MAX_WIDTH, settings.LOGO_MAX_HEIGHT))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            out = io.BytesIO()
+            image.save(out, format="PNG", optimize=True)
+            return out.getvalue()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Invalid image: {e}")
+
+def logo_hash(png: bytes) -> str:
+    return hashlib.sha256(png).hexdigest()
+
+def _to_data_uri(png: bytes) -> str:
+    return "data:image/png;base64," + base64.b64encode(png).decode()
+
+def _memory_get(key: str) -> Optional[str]:
+    with _lock:
+        uri = _memory_cache.get(key)
+        if uri is not None:
+            _memory_cache.move_to_end(key)
+        return uri
+
+def _memory_put(key: str, uri: str) -> None:
+    with _lock:
+        _memory_cache[key] = uri
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+def _disk_path(key: str) -> str:
+    return os.path.join(settings.LOGO_CACHE_DIR, f"{key}.png")
+
+def _disk_get(key: str) -> Optional[bytes]:
+    try:
+        with open(_disk_path(key), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def store(key: str, png: bytes) -> str:
+    """Caches a prepared logo on disk and in memory; returns its data URI."""
+    os.makedirs(settings.LOGO_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=settings.LOGO_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, _disk_path(key))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    uri = _to_data_uri(png)
+    _memory_put(key, uri)
+    return uri
+
+_FETCH_CHUNK_BYTES = 64 * 1024
+
+def _fetch_remote(url: str) -> bytes:
+    """
+    Downloads a remote logo with a size cap and an overall deadline. The urlopen
+    timeout only bounds each socket operation, so a host dripping bytes is cut off
+    by checking the deadline after every chunk.
+    """
+    deadline = time.monotonic() + settings.LOGO_FETCH_TIMEOUT_SECONDS
+    request = urllib.request.Request(url, headers={"User-Agent": "ShooperInvoiceRenderer"})
+    with urllib.request.urlopen(request, timeout=settings.LOGO_FETCH_TIMEOUT_SECONDS) as response:
+        chunks, size = [], 0
+        while True:
+            if time.monotonic() > deadline:
+                raise TimeoutError("Remote logo download timed out")
+            # read1 returns after a single socket read instead of waiting for a full chunk
+            chunk = response.read1(_FETCH_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > settings.LOGO_MAX_UPLOAD_BYTES:
+                raise ValueError("Remote logo is too large")
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+def is_cached(key: str) -> bool:
+    return _memory_get(key) is not None or os.path.exists(_disk_path(key))
+
+async def load_uploaded_logo(db: AsyncSession, business: BusinessConfigORM) -> None:
+    """
+    Loads the deferred logo bytes if the local caches can't serve them, so that
+    logo_data_uri() never needs a lazy load (which AsyncSession can't do).
+    """
+    if business.logo_hash and not is_cached(business.logo_hash):
+        await db.refresh(business, ["logo_data"])
+
+def _resolve_uploaded(business: BusinessConfigORM) -> Optional[str]:
+    key = business.logo_hash
+    uri = _memory_get(key)
+    if uri is not None:
+        return uri
+    png = _disk_get(key)
+    if png is not None:
+        uri = _to_data_uri(png)
+        _memory_put(key, uri)
+        return uri
+    # Only now touch the deferred column (see load_uploaded_logo)
+    if business.logo_data:
+        return store(key, business.logo_data)
+    return None
+
+def resolve_remote_logo(url: str) -> Optional[str]:
+    """Returns a logo_url as a data: URI, downloading and resizing it on first use."""
+    if url.startswith("data:"):
+        return url
+    if not url.startswith(("http://", "https://")):
+        return None
+
+    key = hashlib.sha256(url.encode()).hexdigest()
+    uri = _memory_get(key)
+    if uri is not None:
+        return uri
+    png = _disk_get(key)
+    if png is not None:
+        uri = _to_data_uri(png)
+        _memory_put(key, uri)
+        return uri
+
+    with _lock:
+        failed_at = _failed_fetches.get(key)
+    if failed_at is not None and time.monotonic() - failed_at < settings.LOGO_FETCH_RETRY_SECONDS:
+        return None
+    try:
+        png = prepare_logo(_fetch_remote(url))
+    except Exception:
+        # Unreachable host or bad image: render without a logo and don't retry for a while
+        with _lock:
+            _failed_fetches[key] = time.monotonic()
+        return None
+    return store(key, png)
+
+def logo_data_uri(business: BusinessConfigORM) -> Optional[str]:
+    """
+    Returns the logo to embed in an invoice as a data: URI, or None.
+    An uploaded logo takes precedence over logo_url.
+    """
+    if business.logo_hash:
+        uri = _resolve_uploaded(business)
+        if uri is not None:
+            return uri
+    if business.logo_url:
+        return resolve_remote_logo(business.logo_url)
+    return None
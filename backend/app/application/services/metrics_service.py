@@ -0,0 +1,141 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+from sqlalchemy import select, delete, func, extract, Integer
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
+from app.infrastructure.database.orm_models.monthly_metrics import MonthlyMetricsORM
+
+def status_column(status: OrderStatus) -> str:
+    """Name of the MonthlyMetricsORM counter column for an order status."""
+    return f"{OrderStatus(status).value.lower()}_count"
+
+async def _apply_delta(db: AsyncSession, user_id: UUID, year: int, month: int, deltas: Dict[str, object]) -> None:
+    """
+    Adds the given deltas to a tenant's monthly rollup row, creating it if needed.
+    Runs as a single INSERT ... ON CONFLICT so concurrent orders don't lose updates.
+    """
+    table = MonthlyMetricsORM.__table__
+    stmt = insert(table).values(user_id=user_id, year=year, month=month, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.year, table.c.month],
+        set_={
+            **{name: table.c[name] + stmt.excluded[name] for name in deltas},
+            "updated_at": func.now(),
+        }
+    )
+    await db.execute(stmt)
+
+async def record_orders(db: AsyncSession, orders: Iterable[OrderORM]) -> None:
+    """
+    Adds a batch of new orders to their rollups with one multi-row upsert,
+    one row per month touched.
+    """
+    table = MonthlyMetricsORM.__table__
+    counters = ["order_count", *[status_column(s) for s in OrderStatus]]
+    rows = defaultdict(lambda: dict.fromkeys(
+        ["total_revenue", "total_profit", "total_tax", "total_commission", *counters], 0
+    ))
+    for order in orders:
+        if not order.date:
+            continue
+        row = rows[(order.user_id, order.date.year, order.date.month)]
+        row["total_revenue"] += order.total_amount or 0
+        row["total_profit"] += order.total_profit or 0
+        row["total_tax"] += order.total_tax or 0
+        row["total_commission"] += order.total_commission or 0
+        row["order_count"] += 1
+        row[status_column(order.status)] += 1
+    if not rows:
+        return
+
+    stmt = insert(table).values([
+        {"user_id": user_id, "year": year, "month": month, **deltas}
+        for (user_id, year, month), deltas in rows.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.year, table.c.month],
+        set_={
+            **{name: table.c[name] + stmt.excluded[name] for name in next(iter(rows.values()))},
+            "updated_at": func.now(),
+        }
+    )
+    await db.execute(stmt)
+
+async def record_status_change(db: AsyncSession, order: OrderORM, old_status: OrderStatus) -> None:
+    """
+    Moves an order from its previous status counter to its current one.
+    The caller must hold the order's row lock from reading old_status until commit,
+    or concurrent status changes apply the same delta twice.
+    """
+    if not order.date or OrderStatus(old_status) == OrderStatus(order.status):
+        return
+    await _apply_delta(db, order.user_id, order.date.year, order.date.month, {
+        status_column(old_status): -1,
+        status_column(order.status): 1,
+    })
+
+async def record_client_removal(db: AsyncSession, user_id: UUID, client_id: UUID) -> None:
+    """
+    Subtracts all of a client's orders from the rollups, one upsert per month touched.
+    Call before the client (and so its orders) is deleted.
+    """
+    year = extract("year", OrderORM.date).cast(Integer)
+    month = extract("month", OrderORM.date).cast(Integer)
+    months = (await db.execute(select(
+        year.label("year"),
+        month.label("month"),
+        func.coalesce(func.sum(OrderORM.total_amount), 0).label("total_revenue"),
+        func.coalesce(func.sum(OrderORM.total_profit), 0).label("total_profit"),
+        func.coalesce(func.sum(OrderORM.total_tax), 0).label("total_tax"),
+        func.coalesce(func.sum(OrderORM.total_commission), 0).label("total_commission"),
+        func.count(OrderORM.id).label("order_count"),
+        *[func.count(OrderORM.id).filter(OrderORM.status == s).label(status_column(s)) for s in OrderStatus],
+    ).where(
+        OrderORM.user_id == user_id,
+        OrderORM.client_id == client_id,
+        OrderORM.date.isnot(None)
+    ).group_by(year, month))).mappings().all()
+
+    for row in months:
+        deltas = {name: -value for name, value in row.items() if name not in ("year", "month")}
+        await _apply_delta(db, user_id, row["year"], row["month"], deltas)
+
+async def rebuild_monthly_metrics(db: AsyncSession, user_id: Optional[UUID] = None) -> int:
+    """
+    Recomputes the rollups from the orders table in one set-based statement,
+    for a single tenant or for everyone. Used for backfills and drift repair.
+    Returns the number of rollup rows written; the caller commits.
+    """
+    year = extract("year", OrderORM.date).cast(Integer)
+    month = extract("month", OrderORM.date).cast(Integer)
+
+    source = select(
+        OrderORM.user_id,
+        year,
+        month,
+        func.coalesce(func.sum(OrderORM.total_amount), 0),
+        func.coalesce(func.sum(OrderORM.total_profit), 0),
+        func.coalesce(func.sum(OrderORM.total_tax), 0),
+        func.coalesce(func.sum(OrderORM.total_commission), 0),
+        func.count(OrderORM.id),
+        *[func.count(OrderORM.id).filter(OrderORM.status == s) for s in OrderStatus],
+        func.now(),
+    ).where(OrderORM.date.isnot(None)).group_by(OrderORM.user_id, year, month)
+
+    clear = delete(MonthlyMetricsORM)
+    if user_id is not None:
+        source = source.where(OrderORM.user_id == user_id)
+        clear = clear.where(MonthlyMetricsORM.user_id == user_id)
+
+    columns = [
+        "user_id", "year", "month",
+        "total_revenue", "total_profit", "total_tax", "total_commission", "order_count",
+        *[status_column(s) for s in OrderStatus],
+        "updated_at",
+    ]
+    await db.execute(clear)
+    result = await db.execute(insert(MonthlyMetricsORM).from_select(columns, source))
+    return result.rowcount
@@ -0,0 +1,111 @@
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import List, Tuple
+from uuid import UUID
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
+from app.infrastructure.database.orm_models.order_item import OrderItemORM
+from app.infrastructure.database.orm_models.client import ClientORM
+from app.application.schemas.order import OrderCreate
+from app.application.services import metrics_service, client_stats_service, pricing
+
+# Largest magnitudes Numeric(10, 2) amounts and Numeric(5, 2) percentages accept
+MAX_AMOUNT = Decimal(10) ** 8
+MAX_PERCENT = Decimal(1000)
+
+CLIENT_NOT_FOUND = "Client not found"
+AMOUNTS_OUT_OF_RANGE = "Order amounts are out of range"
+
+def _in_range(items: List[dict], totals: dict) -> bool:
+    amounts = list(totals.values())
+    percents = []
+    for item in items:
+        amounts += [item["base_price"], item["tax_amount"], item["commission_amount"], item["final_price"]]
+        percents += [item["tax_percent"], item["commission_percent"]]
+    return all(abs(a) < MAX_AMOUNT for a in amounts) and all(abs(p) < MAX_PERCENT for p in percents)
+
+async def create_orders(
+    db: AsyncSession, user_id: UUID, orders_in: List[OrderCreate]
+) -> Tuple[List[Tuple[int, dict]], List[Tuple[int, str]]]:
+    """
+    Creates a batch of orders in a fixed number of statements: one client lookup,
+    one multi-row INSERT ... RETURNING for orders, one for items and one upsert
+    each for the dashboard rollups and client stats. Orders that fail validation
+    are reported by index and skipped; the rest are inserted. The caller commits.
+
+    Returns ([(index, order)], [(index, error)]), where each order is a dict of the
+    inserted row with its "items", ready to serialize as the Order schema.
+    """
+    client_ids = {order_in.client_id for order_in in orders_in}
+    known_clients = set((await db.execute(select(ClientORM.id).where(
+        ClientORM.user_id == user_id,
+        ClientORM.id.in_(client_ids)
+    ))).scalars())
+
+    accepted = []
+    errors = []
+    for index, order_in in enumerate(orders_in):
+        if order_in.client_id not in known_clients:
+            errors.append((index, CLIENT_NOT_FOUND))
+            continue
+        try:
+            items, totals = pricing.price_items(order_in.items)
+        except (ValueError, InvalidOperation):
+            # Infinity/NaN, or too large to round to cents
+            errors.append((index, AMOUNTS_OUT_OF_RANGE))
+            continue
+        # Checked after rounding, so nothing Postgres rounds up past the column limits gets through
+        if not _in_range(items, totals):
+            errors.append((index, AMOUNTS_OUT_OF_RANGE))
+            continue
+        accepted.append((index, order_in, items, totals))
+    if not accepted:
+        return [], errors
+
+    order_table = OrderORM.__table__
+    item_table = OrderItemORM.__table__
+    # sort_by_parameter_order pairs each RETURNING row with the parameter set it came from
+    orders = (await db.execute(
+        insert(order_table).returning(*order_table.c, sort_by_parameter_order=True),
+        [
+            {
+                "client_id": order_in.client_id,
+                "user_id": user_id,
+                "payment_bank": order_in.payment_bank,
+                "payment_method": order_in.payment_method,
+                # Core inserts write an explicit None as NULL; keep the ORM default of today
+                "date": order_in.date or datetime.utcnow().date(),
+                "notes": order_in.notes,
+                "status": OrderStatus.PENDING,
+                **totals,
+            }
+            for _, order_in, _, totals in accepted
+        ]
+    )).mappings().all()
+
+    item_rows = [
+        {"order_id": order["id"], **item}
+        for order, (_, _, items, _) in zip(orders, accepted)
+        for item in items
+    ]
+    items_by_order = defaultdict(list)
+    if item_rows:
+        inserted_items = (await db.execute(
+            insert(item_table).returning(*item_table.c, sort_by_parameter_order=True),
+            item_rows
+        )).mappings()
+        for item in inserted_items:
+            items_by_order[item["order_id"]].append(dict(item))
+
+    # Transient copies carrying what the rollups need; they are never added to the session
+    await metrics_service.record_orders(db, [OrderORM(**order) for order in orders])
+    await client_stats_service.record_orders(db, [OrderORM(**order) for order in orders])
+
+    created = [
+        (index, {**order, "items": items_by_order[order["id"]]})
+        for order, (index, _, _, _) in zip(orders, accepted)
+    ]
+    return created, errors
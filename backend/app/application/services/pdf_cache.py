@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+
+from app.core.config import settings
+from app.application.services.pdf_service import TEMPLATE_DIR, INVOICE_TEMPLATE, INVOICE_STYLESHEET
+
+def _template_fingerprint() -> str:
+    """Hash of the invoice template and stylesheet, so editing either invalidates the cache."""
+    digest = hashlib.sha256()
+    for path in (os.path.join(TEMPLATE_DIR, INVOICE_TEMPLATE), INVOICE_STYLESHEET):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+_TEMPLATE_FINGERPRINT = _template_fingerprint()
+
+def cache_key(order_data: dict, business_data: dict, client_data: dict) -> str:
+    """
+    Content address of an invoice: identical inputs always render the same PDF,
+    and any change to the order, client or business data yields a new key.
+    """
+    payload = json.dumps(
+        {"order": order_data, "business": business_data, "client": client_data, "template": _TEMPLATE_FINGERPRINT},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+# Eviction trims the cache to this fraction of PDF_CACHE_MAX_BYTES, so the directory is
+# scanned once per ~10% of the limit written rather than on every put
+_EVICT_TO_FRACTION = 0.9
+# Bytes this process believes the cache holds: the total found by the last scan plus what
+# it has written since. Other workers' writes are picked up by the next scan.
+_estimated_bytes = None
+_size_lock = threading.Lock()
+
+def _path(key: str) -> str:
+    return os.path.join(settings.PDF_CACHE_DIR, f"{key}.pdf")
+
+def get(key: str) -> Optional[bytes]:
+    """Returns the cached PDF for `key`, marking it as recently used, or None."""
+    path = _path(key)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path) # mtime doubles as the LRU timestamp
+        return data
+    except FileNotFoundError:
+        return None
+
+def put(key: str, data: bytes) -> None:
+    """
+    Stores a rendered PDF. Once the cache is estimated to exceed its size limit,
+    the least recently used PDFs are evicted.
+    """
+    os.makedirs(settings.PDF_CACHE_DIR, exist_ok=True)
+    # Write-then-rename so concurrent readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=settings.PDF_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, _path(key))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    global _estimated_bytes
+    with _size_lock:
+        if _estimated_bytes is not None:
+            _estimated_bytes += len(data)
+            if _estimated_bytes <= settings.PDF_CACHE_MAX_BYTES:
+                return
+        _estimated_bytes = _evict()
+
+def _evict() -> int:
+    """Deletes the least recently used PDFs down to the low-water mark; returns the bytes left."""
+    entries = []
+    with os.scandir(settings.PDF_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".pdf"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    if total <= settings.PDF_CACHE_MAX_BYTES:
+        return total
+    for _, size, path in sorted(entries):
+        if total <= settings.PDF_CACHE_MAX_BYTES * _EVICT_TO_FRACTION:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+    return total
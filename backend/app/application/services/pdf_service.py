@@ -1,25 +1,151 @@
+import asyncio
 import os
+import threading
+import multiprocessing
+from typing import Any, Iterable, Iterator, Tuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
+
+from app.core.config import settings
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "templates")
+INVOICE_TEMPLATE = "order_invoice.html"
+INVOICE_STYLESHEET = os.path.join(TEMPLATE_DIR, "order_invoice.css")
+
+# Templates are compiled once per process; auto_reload is off so renders skip the mtime check
+_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), auto_reload=False, cache_size=-1)
+
+# WeasyPrint font configurations are not thread-safe, so each worker thread keeps its own
+# font configuration and the stylesheet parsed against it.
+# WeasyPrint (and its Pango/Cairo bindings) is imported on first use: only render worker
+# processes load it, never the API workers that just hand renders to the pool.
+_render_state = threading.local()
+
+def _get_render_resources():
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+    if not hasattr(_render_state, "stylesheet"):
+        _render_state.font_config = FontConfiguration()
+        _render_state.stylesheet = CSS(filename=INVOICE_STYLESHEET, font_config=_render_state.font_config)
+    return _render_state.font_config, _render_state.stylesheet
 
 def generate_order_pdf(order_data: dict, business_data: dict, client_data: dict) -> bytes:
     """
     Generates a PDF bytes object from an HTML template using WeasyPrint and Jinja2.
+    The compiled template, stylesheet and fonts are reused across renders.
     """
-    # Get template directory
-    template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "templates")
-    
-    # Initialize Jinja environment
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template("order_invoice.html")
-    
+    from weasyprint import HTML
+
+    template = _env.get_template(INVOICE_TEMPLATE)
+    font_config, stylesheet = _get_render_resources()
+
     # Render template with data
     html_out = template.render(
         order=order_data,
         business=business_data,
         client=client_data
     )
-    
+
     # Generate PDF
-    pdf_bytes = HTML(string=html_out).write_pdf()
+    pdf_bytes = HTML(string=html_out).write_pdf(stylesheets=[stylesheet], font_config=font_config)
     return pdf_bytes
+
+
+class PdfRendererBusy(Exception):
+    """Raised when every render worker is busy and the pending queue is full."""
+
+# Renders run in separate processes so WeasyPrint's CPU time never holds the API's GIL.
+# The semaphore bounds running + queued renders; callers beyond that are rejected.
+_executor = None
+_executor_lock = threading.Lock()
+_render_slots = threading.BoundedSemaphore(settings.PDF_WORKERS + settings.PDF_MAX_PENDING)
+
+def _warm_up_worker():
+    _env.get_template(INVOICE_TEMPLATE)
+    _get_render_resources()
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up_worker
+            )
+        return _executor
+
+def _discard_executor(broken: ProcessPoolExecutor) -> None:
+    """Drops a pool whose worker died so the next render starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+async def render_order_pdf(order_data: dict, business_data: dict, client_data: dict) -> bytes:
+    """
+    Renders an invoice on the PDF process pool without blocking the event loop.
+    Raises PdfRendererBusy when the pool is saturated and
+    asyncio.TimeoutError when the render exceeds the configured timeout.
+    """
+    if not _render_slots.acquire(blocking=False):
+        raise PdfRendererBusy()
+    executor = _get_executor()
+    try:
+        future = executor.submit(generate_order_pdf, order_data, business_data, client_data)
+    except BaseException as exc:
+        _render_slots.release()
+        if isinstance(exc, BrokenProcessPool):
+            _discard_executor(executor)
+        raise
+    # The slot is freed when the render finishes, even if the caller gave up waiting
+    future.add_done_callback(lambda _: _render_slots.release())
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), settings.PDF_RENDER_TIMEOUT_SECONDS)
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+
+def render_many(jobs: Iterable[Tuple[Any, dict, dict, dict]]) -> Iterator[Tuple[Any, bytes]]:
+    """
+    Renders (tag, order_data, business_data, client_data) jobs across the process pool,
+    yielding (tag, pdf_bytes) in completion order. Jobs are pulled lazily and at most
+    PDF_WORKERS renders are outstanding, so memory stays bounded however many jobs there are.
+    Raises PdfRendererBusy if a pool slot doesn't free up within the render timeout.
+    """
+    executor = _get_executor()
+    jobs = iter(jobs)
+    pending = {}
+    try:
+        while True:
+            for tag, order_data, business_data, client_data in jobs:
+                # Wait for a slot instead of failing fast: exports queue behind interactive renders
+                if not _render_slots.acquire(timeout=settings.PDF_RENDER_TIMEOUT_SECONDS):
+                    raise PdfRendererBusy()
+                try:
+                    future = executor.submit(generate_order_pdf, order_data, business_data, client_data)
+                except BaseException:
+                    _render_slots.release()
+                    raise
+                future.add_done_callback(lambda _: _render_slots.release())
+                pending[future] = tag
+                if len(pending) >= settings.PDF_WORKERS:
+                    break
+            if not pending:
+                return
+
+            done, _ = wait(pending, timeout=settings.PDF_RENDER_TIMEOUT_SECONDS, return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError("Invoice rendering timed out")
+            for future in done:
+                yield pending.pop(future), future.result()
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+    finally:
+        # Client went away or a render failed: don't leave queued renders behind
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,69 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, List, Tuple, Union
+
+from app.application.schemas.order import OrderItemCreate
+
+CENT = Decimal("0.01")
+HUNDRED = Decimal(100)
+
+def to_decimal(value: Union[int, float, Decimal]) -> Decimal:
+    """Exact decimal for an API number; floats go through their shortest repr (0.1 -> 0.1)."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+def to_cents(value: Decimal) -> Decimal:
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+def _input_amount(value: Union[int, float, Decimal]) -> Decimal:
+    """An API price or percentage rounded to cents, as its Numeric column will store it."""
+    value = to_decimal(value)
+    if not value.is_finite():
+        raise ValueError("Amounts must be finite numbers")
+    return to_cents(value)
+
+def price_line(item: OrderItemCreate) -> dict:
+    """
+    Prices one line item as an order_items row (without order_id). Tax applies to
+    the base price and commission to the price with tax; each line amount is
+    computed exactly and rounded to cents once.
+    Raises ValueError for non-finite inputs and decimal.InvalidOperation for
+    values too large to round to cents.
+    """
+    base_price = _input_amount(item.base_price)
+    tax_percent = _input_amount(item.tax_percent)
+    commission_percent = _input_amount(item.commission_percent)
+    qty = item.quantity
+
+    tax_per_unit = base_price * tax_percent / HUNDRED
+    # Commission is on (base_price + tax), according to constraints
+    commission_per_unit = (base_price + tax_per_unit) * commission_percent / HUNDRED
+
+    tax_amount = to_cents(tax_per_unit * qty)
+    commission_amount = to_cents(commission_per_unit * qty)
+    final_price = to_cents(base_price * qty) + tax_amount + commission_amount
+    return {
+        "name": item.name,
+        "base_price": base_price,
+        "tax_percent": tax_percent,
+        "commission_percent": commission_percent,
+        "quantity": qty,
+        "tax_amount": tax_amount,
+        "commission_amount": commission_amount,
+        "final_price": final_price,
+        "profit_amount": commission_amount, # as simple rule
+    }
+
+def price_items(items: Iterable[OrderItemCreate]) -> Tuple[List[dict], dict]:
+    """
+    Prices all line items of an order and returns (item rows, order totals).
+    Totals are sums of the rounded lines, so they always match the items.
+    """
+    lines = [price_line(item) for item in items]
+    totals = {
+        "total_tax": sum((line["tax_amount"] for line in lines), Decimal(0)),
+        "total_commission": sum((line["commission_amount"] for line in lines), Decimal(0)),
+        "total_profit": sum((line["profit_amount"] for line in lines), Decimal(0)),
+        "total_amount": sum((line["final_price"] for line in lines), Decimal(0)),
+    }
+    return lines, totals
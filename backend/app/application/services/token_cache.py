@@ -0,0 +1,51 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+# Bearer tokens that already passed signature and payload validation, keyed by a hash of the
+# raw token and kept until the token's own expiry, so repeat requests skip the JWT decode.
+_entries = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+def _key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+def get(token: str) -> Optional[UUID]:
+    """User id of a previously verified, still unexpired token."""
+    global _hits, _misses
+    key = _key(token)
+    now = time.time()
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] > now:
+            _entries.move_to_end(key)
+            _hits += 1
+            return entry[1]
+        if entry is not None:
+            del _entries[key]
+        _misses += 1
+        return None
+
+def put(token: str, user_id: UUID, expires_at: float) -> None:
+    key = _key(token)
+    with _lock:
+        _entries[key] = (expires_at, user_id)
+        _entries.move_to_end(key)
+        while len(_entries) > settings.TOKEN_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+def stats() -> dict:
+    with _lock:
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "size": len(_entries),
+            "max_size": settings.TOKEN_CACHE_MAX_ENTRIES,
+        }
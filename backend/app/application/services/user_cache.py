@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.infrastructure.database.orm_models.user import UserORM
+
+# Authenticated users, with their business config, are kept per worker process for a short TTL
+# so the several API calls behind one page don't each repeat the same lookup. Cached instances
+# are detached from any session: only attributes loaded up front may be read from them.
+_entries = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+def get(user_id: UUID) -> Optional[UserORM]:
+    global _hits, _misses
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            _entries.move_to_end(user_id)
+            _hits += 1
+            return entry[1]
+        if entry is not None:
+            del _entries[user_id]
+        _misses += 1
+        return None
+
+def put(user: UserORM) -> None:
+    with _lock:
+        _entries[user.id] = (time.monotonic() + settings.USER_CACHE_TTL_SECONDS, user)
+        _entries.move_to_end(user.id)
+        while len(_entries) > settings.USER_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+def invalidate(user_id: UUID) -> None:
+    """Drops a user after their account or business config changes in this process."""
+    with _lock:
+        _entries.pop(user_id, None)
+
+def stats() -> dict:
+    with _lock:
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "size": len(_entries),
+            "max_size": settings.USER_CACHE_MAX_ENTRIES,
+        }
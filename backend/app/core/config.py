@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -8,6 +9,45 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-prod")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7 # 7 days
+
+    # Connection pools, per engine and per worker process (the API engine and the sync
+    # engine used by exports and scripts each get their own pool)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800 # -1 disables
+    # Test each connection with a round trip on checkout. With this off, stale connections
+    # are bounded by DB_POOL_RECYCLE_SECONDS and surface as an error on first use.
+    DB_POOL_PRE_PING: bool = True
+    # Behind PgBouncer in transaction mode: no app-side pooling, no named prepared statements
+    DB_PGBOUNCER: bool = False
+
+    # Password hashing: stored hashes are upgraded on login when BCRYPT_ROUNDS changes
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16 # hash/verify calls allowed to queue before returning 429
+
+    # PDF rendering process pool
+    PDF_WORKERS: int = 2
+    PDF_MAX_PENDING: int = 8 # renders allowed to wait for a worker before returning 503
+    PDF_RENDER_TIMEOUT_SECONDS: float = 30.0
+
+    # Rendered invoice cache (content-addressed, LRU-evicted on disk)
+    PDF_CACHE_DIR: str = os.getenv("PDF_CACHE_DIR", os.path.join(tempfile.gettempdir(), "shooper_pdf_cache"))
+    PDF_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # Business logos embedded in invoices (resized once, cached in memory and on disk)
+    LOGO_CACHE_DIR: str = os.getenv("LOGO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "shooper_logo_cache"))
+    LOGO_MAX_UPLOAD_BYTES: int = 2 * 1024 * 1024
+    LOGO_MAX_WIDTH: int = 300
+    LOGO_MAX_HEIGHT: int = 160
+    LOGO_FETCH_TIMEOUT_SECONDS: float = 3.0
+    LOGO_FETCH_RETRY_SECONDS: int = 300 # how long a failed remote logo fetch is remembered
+
+    # Per-process cache of authenticated users; other workers see changes after at most the TTL
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_ENTRIES: int = 1024
+    TOKEN_CACHE_MAX_ENTRIES: int = 4096 # verified bearer tokens, each kept until it expires
     
     class Config:
         case_sensitive = True
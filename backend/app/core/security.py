@@ -1,10 +1,13 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Optional, Tuple, Union
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -24,3 +27,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when every password hashing worker is busy and the pending queue is full."""
+
+# bcrypt gets its own small pool so a login storm can't take over the threadpool that
+# serves everything else; the semaphore bounds running + queued work and rejects the rest.
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_PENDING)
+
+async def _run_hasher(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        future = _hash_executor.submit(fn, *args)
+    except BaseException:
+        _hash_slots.release()
+        raise
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(future)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies a password on the hashing pool. Returns (valid, new_hash), where new_hash
+    is set when the stored hash uses outdated settings (e.g. a different BCRYPT_ROUNDS).
+    Raises PasswordHasherBusy when the pool is saturated.
+    """
+    return await _run_hasher(pwd_context.verify_and_update, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Hashes a password on the hashing pool. Raises PasswordHasherBusy when it's saturated."""
+    return await _run_hasher(pwd_context.hash, password)
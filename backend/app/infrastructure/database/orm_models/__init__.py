@@ -4,6 +4,7 @@ from app.infrastructure.database.orm_models.business_config import BusinessConfi
 from app.infrastructure.database.orm_models.client import ClientORM
 from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
 from app.infrastructure.database.orm_models.order_item import OrderItemORM
+from app.infrastructure.database.orm_models.monthly_metrics import MonthlyMetricsORM
 
 __all__ = [
     "Base",
@@ -12,5 +13,6 @@ __all__ = [
     "ClientORM",
     "OrderORM",
     "OrderStatus",
-    "OrderItemORM"
+    "OrderItemORM",
+    "MonthlyMetricsORM"
 ]
@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from app.infrastructure.database.orm_models.base import Base
 
@@ -13,6 +13,9 @@ class BusinessConfigORM(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
     business_name = Column(String, default="My Shopper")
     logo_url = Column(String, nullable=True)
+    # Uploaded logo, already resized to PNG; deferred so settings reads don't load the bytes
+    logo_data = deferred(Column(LargeBinary, nullable=True))
+    logo_hash = Column(String(64), nullable=True)
     base_currency = Column(String, default="USD")
     contact_email = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, Index, DDL, event, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -8,6 +8,12 @@ from app.infrastructure.database.orm_models.base import Base
 
 class ClientORM(Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        # Keyset pagination of the clients listing
+        Index("ix_clients_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Duplicate detection by email during imports
+        Index("ix_clients_user_id_email", "user_id", "email"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True) # Multitenancy
@@ -18,6 +24,47 @@ class ClientORM(Base):
     address = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Lifetime stats (non-cancelled orders), maintained by the order endpoints
+    total_orders = Column(Integer, nullable=False, default=0, server_default="0")
+    total_spent = Column(Numeric(14, 2), nullable=False, default=0, server_default="0")
+    last_order_at = Column(DateTime, nullable=True)
+
     # Relationships
     user = relationship("UserORM", back_populates="clients")
     orders = relationship("OrderORM", back_populates="client", cascade="all, delete-orphan")
+
+# Best-clients ranking reads the top-N per tenant straight off this index
+Index("ix_clients_user_id_total_spent", ClientORM.user_id, ClientORM.total_spent.desc())
+
+# Client search: trigram matching on an accent- and case-folded document of name, last name,
+# email and phone. unaccent() itself isn't IMMUTABLE, so it's wrapped to be usable in an index.
+SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION shooper_unaccent(text) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+    "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$",
+]
+for statement in SEARCH_DDL:
+    event.listen(ClientORM.__table__, "before_create", DDL(statement))
+
+def fold_text(expr):
+    """Lower-cases and strips accents, the same way for queries and the index."""
+    return func.shooper_unaccent(func.lower(expr))
+
+# Constants are rendered inline so queries repeat the indexed expression exactly
+_EMPTY, _SPACE = literal_column("''"), literal_column("' '")
+SEARCH_DOCUMENT = fold_text(
+    func.coalesce(ClientORM.name, _EMPTY) + _SPACE +
+    func.coalesce(ClientORM.last_name, _EMPTY) + _SPACE +
+    func.coalesce(ClientORM.email, _EMPTY) + _SPACE +
+    func.coalesce(ClientORM.phone, _EMPTY)
+)
+
+# An index on a function expression isn't attached to a table automatically, so attach it explicitly
+ClientORM.__table__.append_constraint(Index(
+    "ix_clients_search_trgm",
+    SEARCH_DOCUMENT.label("search_document"),
+    postgresql_using="gin",
+    postgresql_ops={"search_document": "gin_trgm_ops"},
+))
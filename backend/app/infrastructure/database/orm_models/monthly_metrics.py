@@ -0,0 +1,28 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.orm_models.base import Base
+
+class MonthlyMetricsORM(Base):
+    """Per-tenant, per-month rollup of order totals, kept in sync by the order endpoints."""
+    __tablename__ = "monthly_metrics"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+
+    total_revenue = Column(Numeric(14, 2), nullable=False, default=0)
+    total_profit = Column(Numeric(14, 2), nullable=False, default=0)
+    total_tax = Column(Numeric(14, 2), nullable=False, default=0)
+    total_commission = Column(Numeric(14, 2), nullable=False, default=0)
+    order_count = Column(Integer, nullable=False, default=0)
+
+    # Per-status counters, one column per OrderStatus value
+    pending_count = Column(Integer, nullable=False, default=0)
+    purchased_count = Column(Integer, nullable=False, default=0)
+    shipped_count = Column(Integer, nullable=False, default=0)
+    delivered_count = Column(Integer, nullable=False, default=0)
+    cancelled_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Numeric, Text, Enum
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Numeric, Text, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -16,6 +16,21 @@ class OrderStatus(str, enum.Enum):
 
 class OrderORM(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Dashboard metrics filter by tenant and date range
+        Index("ix_orders_user_id_date", "user_id", "date"),
+        # Keyset pagination of the orders listing
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Listing filtered by status, usually with a date range ("pending this week")
+        Index("ix_orders_user_id_status_date", "user_id", "status", "date"),
+        # Open orders are the ones staff page through; keep that listing on a small index
+        Index(
+            "ix_orders_open_user_id_created_at_id", "user_id", "created_at", "id",
+            postgresql_where=text("status IN ('PENDING', 'PURCHASED', 'SHIPPED')")
+        ),
+        # All orders of one client, in listing order
+        Index("ix_orders_client_id_created_at_id", "client_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False, index=True)
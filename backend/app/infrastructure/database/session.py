@@ -1,14 +1,129 @@
-from sqlalchemy import create_engine
+import threading
+import time
+import uuid
+from sqlalchemy import create_engine, exc
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+def _async_database_url(url: str) -> str:
+    """Points a postgres URL at the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+class PoolMetrics:
+    """Checkout counters for one engine's pool: how often and how long requests wait for a connection."""
+
+    def __init__(self):
+        self.pool_class = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            stats = {
+                "pool": self.pool_class,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_avg": self.wait_seconds_total / self.checkouts if self.checkouts else 0.0,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                checked_out=pool.checkedout(),
+                idle=pool.checkedin(),
+            )
+            # A negative max_overflow means no limit, so there's no capacity to measure against
+            if settings.DB_MAX_OVERFLOW >= 0 and pool.size() + settings.DB_MAX_OVERFLOW > 0:
+                stats["utilization"] = pool.checkedout() / (pool.size() + settings.DB_MAX_OVERFLOW)
+        return stats
+
+def _timed_pool(pool_class, metrics: PoolMetrics):
+    """
+    Subclass of pool_class that times each checkout, including waiting for a free
+    connection, opening a new one and the pre-ping. Pools recreated after a
+    disconnect keep the same class and therefore the same metrics.
+    """
+    metrics.pool_class = pool_class.__name__
+
+    class TimedPool(pool_class):
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                metrics.record(time.perf_counter() - start, timed_out=True)
+                raise
+            metrics.record(time.perf_counter() - start)
+            return connection
+    return TimedPool
+
+def _engine_options(pool_class, metrics: PoolMetrics) -> dict:
+    if settings.DB_PGBOUNCER:
+        # PgBouncer does the pooling; every checkout opens a fresh (cheap) PgBouncer connection
+        return {"poolclass": _timed_pool(NullPool, metrics)}
+    return {
+        "poolclass": _timed_pool(pool_class, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def _asyncpg_connect_args() -> dict:
+    if not settings.DB_PGBOUNCER:
+        return {}
+    # A transaction-mode PgBouncer may hand each transaction a different server connection,
+    # so statements must not be cached, and any that asyncpg prepares get a unique name
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+# Sync engine: Alembic, seed_admin.py, maintenance scripts and streaming exports
+engine = create_engine(settings.DATABASE_URL, **_engine_options(QueuePool, sync_pool_metrics))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def get_db():
-    db = SessionLocal()
-    try:
+# Async engine used by the API routers
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    connect_args=_asyncpg_connect_args(),
+    **_engine_options(AsyncAdaptedQueuePool, async_pool_metrics)
+)
+# Objects stay usable after commit; lazy loads aren't possible on AsyncSession anyway
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+def pool_stats() -> dict:
+    """Pool checkout wait times and utilization for this worker, for monitoring."""
+    return {
+        "api": async_pool_metrics.snapshot(async_engine.sync_engine.pool),
+        "sync": sync_pool_metrics.snapshot(engine.pool),
+    }
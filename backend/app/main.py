@@ -8,11 +8,9 @@ app = FastAPI(
 )
 
 from app.presentation.api_v1.api import api_router
-from app.infrastructure.database.session import engine
-from app.infrastructure.database.orm_models import Base
-
-# Create all database tables (useful for initial deploy if Alembic isn't configured)
-Base.metadata.create_all(bind=engine)
+from app.infrastructure.database.session import pool_stats
+from app.presentation.pagination import NEXT_CURSOR_HEADER
+from app.application.services import user_cache, token_cache
 
 # CORS config
 app.add_middleware(
@@ -21,6 +19,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router, prefix="/api/v1")
@@ -28,3 +27,12 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/health")
 def health_check():
     return {"status": "ok", "message": "API is running"}
+
+@app.get("/metrics")
+def metrics():
+    """Cache counters and connection pool usage for this worker, for monitoring."""
+    return {
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "db_pool": pool_stats(),
+    }
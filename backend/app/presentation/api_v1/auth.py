@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any
 
 from app.infrastructure.database.session import get_db
@@ -14,32 +15,43 @@ from app.infrastructure.database.orm_models.business_config import BusinessConfi
 
 router = APIRouter()
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts in progress, try again shortly",
+        headers={"Retry-After": "1"}
+    )
+
 class SetupAdminRequest(BaseModel):
     email: EmailStr
     password: str
     business_name: str
 
 @router.post("/setup-admin", status_code=status.HTTP_201_CREATED)
-def setup_first_admin(data: SetupAdminRequest, db: Session = Depends(get_db)):
+async def setup_first_admin(data: SetupAdminRequest, db: AsyncSession = Depends(get_db)):
     """
     Creates the first admin user securely.
     This endpoint ONLY works if there are NO users in the database.
     """
-    if db.query(UserORM).first() is not None:
+    if (await db.execute(select(UserORM.id).limit(1))).first() is not None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
             detail="Setup already completed. At least one user exists."
         )
 
     # 1. Create the user
+    try:
+        hashed_password = await security.get_password_hash_async(data.password)
+    except security.PasswordHasherBusy:
+        raise _hasher_busy()
     new_user = UserORM(
         email=data.email,
-        hashed_password=security.get_password_hash(data.password),
+        hashed_password=hashed_password,
         is_active=True
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     # 2. Create default business config
     new_config = BusinessConfigORM(
@@ -49,23 +61,35 @@ def setup_first_admin(data: SetupAdminRequest, db: Session = Depends(get_db)):
         contact_email=data.email
     )
     db.add(new_config)
-    db.commit()
+    await db.commit()
 
     return {"message": f"Admin user {data.email} created successfully!"}
 
 
 @router.post("/login/access-token", response_model=Token)
-def login_access_token(
-    db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: AsyncSession = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = db.query(UserORM).filter(UserORM.email == form_data.username).first()
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    user = (await db.execute(select(UserORM).where(UserORM.email == form_data.username))).scalars().first()
+    if not user:
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    # bcrypt runs on its own bounded pool; when that is saturated, shed load instead of queueing
+    try:
+        valid, new_hash = await security.verify_password_async(form_data.password, user.hashed_password)
+    except security.PasswordHasherBusy:
+        raise _hasher_busy()
+    if not valid:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+
+    # The stored hash predates the current BCRYPT_ROUNDS: upgrade it while we have the password
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
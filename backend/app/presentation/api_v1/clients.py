@@ -1,31 +1,76 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from itertools import islice
+from fastapi import APIRouter, Depends, HTTPException, status, Response, UploadFile, File, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, func, literal, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from uuid import UUID
 
 from app.infrastructure.database.session import get_db
-from app.infrastructure.database.orm_models.client import ClientORM
-from app.application.schemas.client import Client, ClientCreate, ClientUpdate
+from app.infrastructure.database.orm_models.client import ClientORM, SEARCH_DOCUMENT, fold_text
+from app.application.schemas.client import Client, ClientCreate, ClientUpdate, ClientImportResult
 from app.presentation.dependencies import get_current_user
+from app.presentation.pagination import keyset_paginate, MAX_PAGE_SIZE
+from app.presentation.streaming import stream_with_own_session
 from app.infrastructure.database.orm_models.user import UserORM
+from app.application.services import metrics_service, client_import_service, export_service
 
 router = APIRouter()
 
+async def _get_client(db: AsyncSession, client_id: UUID, user_id: UUID) -> ClientORM:
+    client = (await db.execute(select(ClientORM).where(
+        ClientORM.id == client_id,
+        ClientORM.user_id == user_id
+    ))).scalars().first()
+    if not client:
+        raise HTTPException(status_code=404, detail="Client not found")
+    return client
+
 @router.get("/", response_model=List[Client])
-def read_clients(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+async def read_clients(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """Retrieve clients for the current Shoper, newest first, one cursor page at a time."""
+    stmt = select(ClientORM).where(ClientORM.user_id == current_user.id)
+    return await keyset_paginate(db, stmt, ClientORM, cursor, limit, response)
+
+@router.get("/search", response_model=List[Client])
+async def search_clients(
+    # Shorter terms have no trigram, so the index couldn't serve the substring match
+    q: str = Query(..., min_length=3, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
-    """Retrieve all clients for the current Shoper."""
-    clients = db.query(ClientORM).filter(ClientORM.user_id == current_user.id).offset(skip).limit(limit).all()
-    return clients
+    """
+    Find clients by part of their name, last name, email or phone, ignoring case and accents.
+    Substring matches and close (typo-tolerant) word matches are returned, best match first.
+    """
+    term = fold_text(literal(q))
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    # Both predicates are served by the trigram index on SEARCH_DOCUMENT
+    stmt = select(ClientORM).where(
+        ClientORM.user_id == current_user.id,
+        or_(
+            SEARCH_DOCUMENT.like(fold_text(literal(f"%{escaped}%"))),
+            term.op("<%")(SEARCH_DOCUMENT)
+        )
+    ).order_by(
+        func.word_similarity(term, SEARCH_DOCUMENT).desc(),
+        ClientORM.last_name,
+        ClientORM.name
+    ).limit(limit)
+    return (await db.execute(stmt)).scalars().all()
 
 @router.post("/", response_model=Client, status_code=status.HTTP_201_CREATED)
-def create_client(
+async def create_client(
     client_in: ClientCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Create a new client."""
@@ -34,63 +79,100 @@ def create_client(
         user_id=current_user.id
     )
     db.add(client)
-    db.commit()
-    db.refresh(client)
+    await db.commit()
+    await db.refresh(client)
     return client
 
+@router.post("/import", response_model=ClientImportResult)
+async def import_clients(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format"),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """
+    Bulk-load clients from a CSV file (with a name,last_name,email,phone,address header)
+    or NDJSON. Rows whose email already exists for this Shoper are skipped.
+    The format is taken from `format` or the file name / content type.
+    """
+    fmt = file_format or client_import_service.detect_format(file.filename, file.content_type)
+    if fmt not in client_import_service.IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"format must be one of {', '.join(client_import_service.IMPORT_FORMATS)}"
+        )
+
+    # The upload is spooled to a temp file; parse it a batch at a time off the event loop
+    rows = client_import_service.iter_rows(file.file, fmt)
+
+    async def batches():
+        while True:
+            batch = await run_in_threadpool(lambda: list(islice(rows, client_import_service.BATCH_SIZE)))
+            if not batch:
+                return
+            yield batch
+
+    try:
+        summary = await client_import_service.import_clients(db, current_user.id, batches())
+    except client_import_service.ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=f"Could not parse file: {e}")
+    await db.commit()
+    return summary
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_clients(
+    file_format: str = Query("csv", alias="format"),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """Stream every client of the current Shoper as CSV or NDJSON, oldest first."""
+    if file_format not in export_service.EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(export_service.EXPORT_FORMATS)}")
+    user_id = current_user.id
+    body = stream_with_own_session(lambda db: export_service.stream_clients(db, user_id, file_format))
+
+    headers = {'Content-Disposition': f'attachment; filename="clients.{file_format}"'}
+    return StreamingResponse(body, headers=headers, media_type=export_service.MEDIA_TYPES[file_format])
+
 @router.get("/{client_id}", response_model=Client)
-def read_client(
+async def read_client(
     client_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Get specific client."""
-    client = db.query(ClientORM).filter(
-        ClientORM.id == client_id,
-        ClientORM.user_id == current_user.id
-    ).first()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client not found")
-    return client
+    return await _get_client(db, client_id, current_user.id)
 
 @router.put("/{client_id}", response_model=Client)
-def update_client(
+async def update_client(
     client_id: UUID,
     client_in: ClientUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Update a client."""
-    client = db.query(ClientORM).filter(
-        ClientORM.id == client_id,
-        ClientORM.user_id == current_user.id
-    ).first()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client not found")
-    
+    client = await _get_client(db, client_id, current_user.id)
+
     update_data = client_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(client, field, value)
-        
+
     db.add(client)
-    db.commit()
-    db.refresh(client)
+    await db.commit()
+    await db.refresh(client)
     return client
 
 @router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_client(
+async def delete_client(
     client_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Delete a client."""
-    client = db.query(ClientORM).filter(
-        ClientORM.id == client_id,
-        ClientORM.user_id == current_user.id
-    ).first()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client not found")
-    
-    db.delete(client)
-    db.commit()
+    client = await _get_client(db, client_id, current_user.id)
+
+    # The client's orders are cascade-deleted, so take them out of the rollups first
+    await metrics_service.record_client_removal(db, current_user.id, client.id)
+    # AsyncSession.delete loads the orders/items cascade inside its own greenlet
+    await db.delete(client)
+    await db.commit()
     return None
@@ -1,43 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import select, func, literal, Date
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, List
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from app.infrastructure.database.session import get_db
-from app.infrastructure.database.orm_models.order import OrderORM
+from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
+from app.infrastructure.database.orm_models.monthly_metrics import MonthlyMetricsORM
 from app.infrastructure.database.orm_models.client import ClientORM
 from app.presentation.dependencies import get_current_user
 from app.infrastructure.database.orm_models.user import UserORM
+from app.application.services import metrics_service
 
 router = APIRouter()
 
 @router.get("/metrics", response_model=Dict[str, Any])
-def get_dashboard_metrics(
+async def get_dashboard_metrics(
     month: int = None,
     year: int = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     if not month:
         month = datetime.now().month
     if not year:
         year = datetime.now().year
-        
-    # Aggregate queries
-    orders_query = db.query(OrderORM).filter(
-        OrderORM.user_id == current_user.id
-        # Note: Proper date filtering requires extract() from SQLAlchemy, 
-        # simplifying here to show structure. Needs SQLAlchemy extract('month', OrderORM.date) == month
-    )
-    
-    # Simple workaround for date
-    orders = orders_query.all()
-    filtered_orders = [o for o in orders if o.date and o.date.month == month and o.date.year == year]
+    if not 1 <= month <= 12:
+        raise HTTPException(status_code=400, detail="Invalid month")
+
+    # Rollups are maintained by the order endpoints, so this is a primary-key lookup
+    metrics = await db.get(MonthlyMetricsORM, (current_user.id, year, month))
 
-    total_revenue = sum(o.total_amount for o in filtered_orders)
-    total_profit = sum(o.total_profit for o in filtered_orders)
-    order_count = len(filtered_orders)
+    total_revenue = metrics.total_revenue if metrics else 0
+    total_profit = metrics.total_profit if metrics else 0
+    order_count = metrics.order_count if metrics else 0
     ticket_promedio = (total_revenue / order_count) if order_count > 0 else 0.0
 
     return {
@@ -46,38 +42,84 @@ def get_dashboard_metrics(
         "total_revenue": total_revenue,
         "total_profit": total_profit,
         "order_count": order_count,
-        "ticket_promedio": ticket_promedio
+        "ticket_promedio": ticket_promedio,
+        "status_counts": {
+            s.value: getattr(metrics, metrics_service.status_column(s)) if metrics else 0
+            for s in OrderStatus
+        }
     }
 
+TIMESERIES_BUCKETS = ("day", "week", "month")
+
+@router.get("/timeseries", response_model=List[Dict[str, Any]])
+async def get_dashboard_timeseries(
+    start_date: date = None,
+    end_date: date = None,
+    bucket: str = "month",
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """
+    Revenue, profit, order count and status breakdown per day, week or month
+    between start_date and end_date (inclusive), computed in a single GROUP BY.
+    Defaults to the last 12 months.
+    """
+    if bucket not in TIMESERIES_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"bucket must be one of {', '.join(TIMESERIES_BUCKETS)}")
+    if not end_date:
+        end_date = datetime.now().date()
+    if not start_date:
+        start_date = end_date - timedelta(days=365)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+
+    # bucket is whitelisted above; rendering it inline keeps SELECT and GROUP BY identical
+    period = func.date_trunc(literal(bucket, literal_execute=True), OrderORM.date).cast(Date).label("period")
+    rows = (await db.execute(select(
+        period,
+        func.coalesce(func.sum(OrderORM.total_amount), 0).label("total_revenue"),
+        func.coalesce(func.sum(OrderORM.total_profit), 0).label("total_profit"),
+        func.count(OrderORM.id).label("order_count"),
+        *[func.count(OrderORM.id).filter(OrderORM.status == s).label(s.value) for s in OrderStatus]
+    ).where(
+        OrderORM.user_id == current_user.id,
+        OrderORM.date >= start_date,
+        OrderORM.date <= end_date
+    ).group_by(period).order_by(period))).all()
+
+    return [
+        {
+            "period": row.period,
+            "total_revenue": row.total_revenue,
+            "total_profit": row.total_profit,
+            "order_count": row.order_count,
+            "status_counts": {s.value: getattr(row, s.value) for s in OrderStatus}
+        }
+        for row in rows
+    ]
+
 @router.get("/best-clients", response_model=List[Dict[str, Any]])
-def get_best_clients(
+async def get_best_clients(
     limit: int = 10,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
-    # This requires a JOIN and GROUP BY
-    results = db.query(
-        ClientORM,
-        func.count(OrderORM.id).label("total_orders"),
-        func.sum(OrderORM.total_amount).label("total_spent")
-    ).outerjoin(
-        OrderORM, ClientORM.id == OrderORM.client_id
-    ).filter(
+    # Lifetime stats are kept on the client row, so this is an index scan
+    clients = (await db.execute(select(ClientORM).where(
         ClientORM.user_id == current_user.id
-    ).group_by(
-        ClientORM.id
     ).order_by(
-        desc("total_spent")
-    ).limit(limit).all()
+        ClientORM.total_spent.desc()
+    ).limit(limit))).scalars().all()
 
     best_clients = []
-    for client, count, spent in results:
+    for client in clients:
         best_clients.append({
             "client_id": client.id,
             "name": f"{client.name} {client.last_name}",
             "email": client.email,
-            "total_orders": count or 0,
-            "total_spent": float(spent) if spent else 0.0
+            "total_orders": client.total_orders or 0,
+            "total_spent": float(client.total_spent) if client.total_spent else 0.0,
+            "last_order_at": client.last_order_at
         })
         
     return best_clients
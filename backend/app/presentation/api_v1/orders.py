@@ -1,190 +1,271 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Header, Query
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, joinedload, load_only
+from typing import List, Optional, Union
 from uuid import UUID
+from datetime import date
 
 from app.infrastructure.database.session import get_db
 from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
-from app.infrastructure.database.orm_models.order_item import OrderItemORM
-from app.infrastructure.database.orm_models.client import ClientORM
-from app.infrastructure.database.orm_models.business_config import BusinessConfigORM
-from app.application.schemas.order import Order, OrderCreate, OrderUpdate
+from app.application.schemas.order import (
+    Order, OrderCreate, OrderUpdate, OrderSummary, OrderBatchCreate, OrderBatchResult, OrderCount
+)
 from app.presentation.dependencies import get_current_user
+from app.presentation.pagination import keyset_paginate, MAX_PAGE_SIZE
+from app.presentation.streaming import stream_with_own_session
 from app.infrastructure.database.orm_models.user import UserORM
-from app.application.services import pdf_service
+from app.application.services import (
+    pdf_service, pdf_cache, invoice_service, metrics_service, client_stats_service, order_service,
+    export_service
+)
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Order])
-def read_orders(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+ORDER_VIEWS = ("full", "summary")
+# Counts stop here; past it the UI shows "10000+" rather than paying for an exact count
+ORDER_COUNT_CAP = 10000
+
+def order_filters(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    order_status: Optional[OrderStatus] = Query(None, alias="status"),
+    client_id: Optional[UUID] = None,
+    payment_method: Optional[str] = None
+) -> list:
+    """Query filters shared by the orders listing and count, as WHERE clauses."""
+    conditions = []
+    if start_date:
+        conditions.append(OrderORM.date >= start_date)
+    if end_date:
+        conditions.append(OrderORM.date <= end_date)
+    if order_status:
+        conditions.append(OrderORM.status == order_status)
+    if client_id:
+        conditions.append(OrderORM.client_id == client_id)
+    if payment_method:
+        conditions.append(OrderORM.payment_method == payment_method)
+    return conditions
+
+# Each view validates into its own schema below: a Union response_model would
+# serialize both views with whichever schema matches first
+@router.get("/", response_model=None)
+async def read_orders(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    view: str = "full",
+    filters: list = Depends(order_filters),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+) -> Union[List[Order], List[OrderSummary]]:
+    """
+    Retrieve orders for the current Shoper, newest first, one cursor page at a time.
+    Optionally filtered by date range, status, client and payment method.
+    view=summary returns only the columns the orders table shows, without items.
+    """
+    if view not in ORDER_VIEWS:
+        raise HTTPException(status_code=400, detail=f"view must be one of {', '.join(ORDER_VIEWS)}")
+
+    stmt = select(OrderORM).where(OrderORM.user_id == current_user.id, *filters)
+
+    if view == "summary":
+        stmt = stmt.options(load_only(
+            OrderORM.id, OrderORM.client_id, OrderORM.status, OrderORM.date,
+            OrderORM.payment_method, OrderORM.total_amount, OrderORM.total_profit,
+            OrderORM.created_at
+        ))
+        orders = await keyset_paginate(db, stmt, OrderORM, cursor, limit, response)
+        return [OrderSummary.model_validate(order) for order in orders]
+
+    # Items for the whole page are fetched in one batched SELECT ... IN
+    stmt = stmt.options(selectinload(OrderORM.items))
+    orders = await keyset_paginate(db, stmt, OrderORM, cursor, limit, response)
+    return [Order.model_validate(order) for order in orders]
+
+@router.get("/count", response_model=OrderCount)
+async def count_orders(
+    filters: list = Depends(order_filters),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
-    """Retrieve all orders for the current Shoper."""
-    orders = db.query(OrderORM).filter(
-        OrderORM.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return orders
+    """
+    Count the orders matching the same filters as the listing.
+    Counting stops after ORDER_COUNT_CAP rows, in which case exact is false.
+    """
+    matching = select(OrderORM.id).where(
+        OrderORM.user_id == current_user.id, *filters
+    ).limit(ORDER_COUNT_CAP + 1).subquery()
+    count = (await db.execute(select(func.count()).select_from(matching))).scalar_one()
+    if count > ORDER_COUNT_CAP:
+        return {"count": ORDER_COUNT_CAP, "exact": False}
+    return {"count": count, "exact": True}
 
 @router.post("/", response_model=Order, status_code=status.HTTP_201_CREATED)
-def create_order(
+async def create_order(
     order_in: OrderCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Create a new order with auto-calculations."""
-    # Validate client belongs to user
-    client = db.query(ClientORM).filter(
-        ClientORM.id == order_in.client_id,
-        ClientORM.user_id == current_user.id
-    ).first()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client not found")
-
-    new_order = OrderORM(
-        client_id=order_in.client_id,
-        user_id=current_user.id,
-        payment_bank=order_in.payment_bank,
-        payment_method=order_in.payment_method,
-        date=order_in.date,
-        notes=order_in.notes,
-        status=OrderStatus.PENDING
-    )
-    
-    db.add(new_order)
-    db.flush() # get new_order.id
-    
-    total_tax = 0.0
-    total_commission = 0.0
-    total_profit = 0.0
-    total_amount = 0.0
-
-    for item_in in order_in.items:
-        base_price = item_in.base_price
-        qty = item_in.quantity
-        
-        # Calculations per product
-        tax_amount_per_unit = (base_price * (item_in.tax_percent / 100))
-        tax_amount_total = tax_amount_per_unit * qty
-        
-        # Commission is usually on (base_price + tax), according to constraints
-        price_with_tax = base_price + tax_amount_per_unit
-        commission_per_unit = price_with_tax * (item_in.commission_percent / 100)
-        commission_total = commission_per_unit * qty
-        
-        final_price = (base_price * qty) + tax_amount_total + commission_total
-        profit_amount = commission_total # as simple rule
-        
-        new_item = OrderItemORM(
-            order_id=new_order.id,
-            name=item_in.name,
-            base_price=base_price,
-            tax_percent=item_in.tax_percent,
-            commission_percent=item_in.commission_percent,
-            quantity=qty,
-            tax_amount=tax_amount_total,
-            commission_amount=commission_total,
-            final_price=final_price,
-            profit_amount=profit_amount
-        )
-        db.add(new_item)
-        
-        total_tax += tax_amount_total
-        total_commission += commission_total
-        total_profit += profit_amount
-        total_amount += final_price
-
-    new_order.total_tax = total_tax
-    new_order.total_commission = total_commission
-    new_order.total_profit = total_profit
-    new_order.total_amount = total_amount
+    # Same write path as the batch endpoint: the response is built from the
+    # INSERT ... RETURNING rows, so nothing is read back after the commit
+    created, errors = await order_service.create_orders(db, current_user.id, [order_in])
+    if errors:
+        detail = errors[0][1]
+        raise HTTPException(status_code=404 if detail == order_service.CLIENT_NOT_FOUND else 400, detail=detail)
+    await db.commit()
+    return created[0][1]
 
-    db.commit()
-    db.refresh(new_order)
-    return new_order
+@router.post("/batch", response_model=OrderBatchResult)
+async def create_orders_batch(
+    batch_in: OrderBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """
+    Create many orders in one transaction with bulk inserts.
+    Orders that can't be created are listed in `errors` by their index; the rest are created.
+    """
+    created, errors = await order_service.create_orders(db, current_user.id, batch_in.orders)
+    await db.commit()
+    return {
+        "created": [{"index": index, "id": order["id"]} for index, order in created],
+        "errors": [{"index": index, "detail": detail} for index, detail in errors],
+    }
 
 @router.patch("/{order_id}/status", response_model=Order)
-def update_order_status(
+async def update_order_status(
     order_id: UUID,
     status_update: OrderUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
-    order = db.query(OrderORM).filter(
+    # Lock the row until commit: the rollup deltas below are computed from the status
+    # read here, so concurrent updates of the same order must not both see the old one
+    order = (await db.execute(select(OrderORM).options(
+        selectinload(OrderORM.items)
+    ).where(
         OrderORM.id == order_id,
         OrderORM.user_id == current_user.id
-    ).first()
+    ).with_for_update())).scalars().first()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
     if status_update.status:
+        old_status = order.status
         order.status = status_update.status
+        await metrics_service.record_status_change(db, order, old_status)
+        await client_stats_service.record_status_change(db, order, old_status)
     if status_update.notes:
         order.notes = status_update.notes
         
-    db.commit()
-    db.refresh(order)
+    await db.commit()
     return order
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_orders(
+    file_format: str = Query("csv", alias="format"),
+    items: bool = False,
+    current_user: UserORM = Depends(get_current_user)
+):
+    """
+    Stream every order of the current Shoper as CSV or NDJSON, oldest first.
+    items=true adds the line items (one CSV row per item, or an "items" array per NDJSON line).
+    """
+    if file_format not in export_service.EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(export_service.EXPORT_FORMATS)}")
+    user_id = current_user.id
+    body = stream_with_own_session(
+        lambda db: export_service.stream_orders(db, user_id, file_format, include_items=items)
+    )
+
+    headers = {'Content-Disposition': f'attachment; filename="orders.{file_format}"'}
+    return StreamingResponse(body, headers=headers, media_type=export_service.MEDIA_TYPES[file_format])
+
+@router.get("/invoices/export", response_class=StreamingResponse)
+def export_invoices(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    order_status: Optional[OrderStatus] = Query(None, alias="status"),
+    client_id: Optional[UUID] = None,
+    current_user: UserORM = Depends(get_current_user)
+):
+    """
+    Stream a ZIP with the PDF invoice of every matching order.
+    PDFs are rendered in parallel and written to the archive as they complete.
+    """
+    user_id = current_user.id
+    archive = stream_with_own_session(
+        lambda db: invoice_service.stream_invoices_zip(
+            db, user_id,
+            start_date=start_date, end_date=end_date,
+            status=order_status, client_id=client_id
+        ),
+        sync=True
+    )
+
+    headers = {'Content-Disposition': 'attachment; filename="invoices.zip"'}
+    return StreamingResponse(archive, headers=headers, media_type="application/zip")
+
 @router.get("/{order_id}/pdf", response_class=Response)
-def get_order_pdf(
+async def get_order_pdf(
     order_id: UUID,
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Generate and return a PDF invoice for the given order."""
-    order = db.query(OrderORM).filter(
+    order = (await db.execute(select(OrderORM).options(
+        joinedload(OrderORM.client),
+        selectinload(OrderORM.items)
+    ).where(
         OrderORM.id == order_id,
         OrderORM.user_id == current_user.id
-    ).first()
+    ))).scalars().first()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-        
-    business = db.query(BusinessConfigORM).filter(BusinessConfigORM.user_id == current_user.id).first()
-    if not business:
-        business = BusinessConfigORM(user_id=current_user.id, business_name="My Shopper")
-
-    # Serialize objects to dict for Jinja2 template
-    order_data = {
-        "id": str(order.id)[:8], # short ID
-        "date": order.date.strftime("%Y-%m-%d") if order.date else "",
-        "status": order.status.value,
-        "payment_method": order.payment_method,
-        "notes": order.notes,
-        "total_tax": round(float(order.total_tax), 2),
-        "total_commission": round(float(order.total_commission), 2),
-        "total_amount": round(float(order.total_amount), 2),
-        "items": [
-            {
-                "name": item.name,
-                "quantity": item.quantity,
-                "base_price": round(float(item.base_price), 2),
-                "final_price": round(float(item.final_price), 2)
-            }
-            for item in order.items
-        ]
-    }
-    
-    business_data = {
-        "business_name": business.business_name,
-        "logo_url": business.logo_url,
-        "contact_email": business.contact_email,
-        "base_currency": business.base_currency
-    }
-    
-    client_data = {
-        "name": order.client.name,
-        "last_name": order.client.last_name,
-        "email": order.client.email,
-        "address": order.client.address
-    }
-    
-    pdf_bytes = pdf_service.generate_order_pdf(order_data, business_data, client_data)
-    
+
+    business = await invoice_service.get_business(db, current_user.id)
+    order_data, business_data, client_data = await run_in_threadpool(
+        invoice_service.build_invoice_data, order, business
+    )
+
+    # Any change to the order, client or business settings changes the key, so stale PDFs are never served
+    cache_key = pdf_cache.cache_key(order_data, business_data, client_data)
     headers = {
-        'Content-Disposition': f'attachment; filename="invoice_{order_data["id"]}.pdf"'
+        'Content-Disposition': f'attachment; filename="invoice_{order_data["id"]}.pdf"',
+        'ETag': f'"{cache_key}"',
+        'Cache-Control': 'private, no-cache'
     }
+    if if_none_match and _etag_matches(if_none_match, cache_key):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    pdf_bytes = await run_in_threadpool(pdf_cache.get, cache_key)
+    if pdf_bytes is not None:
+        return Response(content=pdf_bytes, headers=headers, media_type="application/pdf")
+
+    try:
+        pdf_bytes = await pdf_service.render_order_pdf(order_data, business_data, client_data)
+    except (pdf_service.PdfRendererBusy, BrokenProcessPool):
+        # A crashed worker pool has already been discarded; the retry gets a fresh one
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Invoice renderer is unavailable, please retry shortly",
+            headers={"Retry-After": "5"}
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Invoice rendering timed out")
+
+    await run_in_threadpool(pdf_cache.put, cache_key, pdf_bytes)
     return Response(content=pdf_bytes, headers=headers, media_type="application/pdf")
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(","))
+    return etag in candidates
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Response, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from uuid import UUID
 
 from app.infrastructure.database.session import get_db
@@ -7,38 +10,40 @@ from app.infrastructure.database.orm_models.business_config import BusinessConfi
 from app.application.schemas.business_config import BusinessConfig, BusinessConfigUpdate
 from app.presentation.dependencies import get_current_user
 from app.infrastructure.database.orm_models.user import UserORM
+from app.application.services import logo_service, user_cache
+from app.core.config import settings
 
 router = APIRouter()
 
 @router.get("/", response_model=BusinessConfig)
-def get_business_config(
-    db: Session = Depends(get_db),
+async def get_business_config(
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Retrieve or create business config for the current Shoper."""
-    config = db.query(BusinessConfigORM).filter(
-        BusinessConfigORM.user_id == current_user.id
-    ).first()
+    # Loaded together with the (possibly cached) user by get_current_user
+    config = current_user.business_config
     
     # Auto-create if not exists
     if not config:
         config = BusinessConfigORM(user_id=current_user.id)
         db.add(config)
-        db.commit()
-        db.refresh(config)
+        await db.commit()
+        await db.refresh(config)
+        user_cache.invalidate(current_user.id)
         
     return config
 
 @router.put("/", response_model=BusinessConfig)
-def update_business_config(
+async def update_business_config(
     config_in: BusinessConfigUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user)
 ):
     """Update business config."""
-    config = db.query(BusinessConfigORM).filter(
+    config = (await db.execute(select(BusinessConfigORM).where(
         BusinessConfigORM.user_id == current_user.id
-    ).first()
+    ))).scalars().first()
     
     if not config:
         # Should normally exist by getting it first
@@ -49,6 +54,77 @@ def update_business_config(
     for field, value in update_data.items():
         setattr(config, field, value)
         
-    db.commit()
-    db.refresh(config)
+    await db.commit()
+    await db.refresh(config)
+    user_cache.invalidate(current_user.id)
+
+    # Download and resize a new remote logo now rather than during the first invoice render
+    if update_data.get("logo_url"):
+        await run_in_threadpool(logo_service.resolve_remote_logo, config.logo_url)
+    return config
+
+async def _get_or_create_config(db: AsyncSession, user_id: UUID) -> BusinessConfigORM:
+    config = (await db.execute(select(BusinessConfigORM).where(
+        BusinessConfigORM.user_id == user_id
+    ))).scalars().first()
+    if not config:
+        config = BusinessConfigORM(user_id=user_id)
+        db.add(config)
+    return config
+
+@router.put("/logo", response_model=BusinessConfig)
+async def upload_logo(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """Upload the business logo. It is resized once and stored for invoice rendering."""
+    raw = await file.read(settings.LOGO_MAX_UPLOAD_BYTES + 1)
+    if len(raw) > settings.LOGO_MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Logo file is too large")
+    try:
+        png = await run_in_threadpool(logo_service.prepare_logo, raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Logo must be a valid image")
+
+    config = await _get_or_create_config(db, current_user.id)
+    config.logo_data = png
+    config.logo_hash = logo_service.logo_hash(png)
+    await db.commit()
+    await db.refresh(config)
+    user_cache.invalidate(current_user.id)
+    await run_in_threadpool(logo_service.store, config.logo_hash, png)
+    return config
+
+@router.get("/logo", response_class=Response)
+async def get_logo(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """Return the uploaded business logo as PNG."""
+    config = (await db.execute(select(BusinessConfigORM).options(
+        undefer(BusinessConfigORM.logo_data)
+    ).where(
+        BusinessConfigORM.user_id == current_user.id
+    ))).scalars().first()
+    if not config or not config.logo_data:
+        raise HTTPException(status_code=404, detail="Logo not found")
+    return Response(
+        content=config.logo_data,
+        media_type="image/png",
+        headers={"ETag": f'"{config.logo_hash}"', "Cache-Control": "private, no-cache"}
+    )
+
+@router.delete("/logo", response_model=BusinessConfig)
+async def delete_logo(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user)
+):
+    """Remove the uploaded business logo."""
+    config = await _get_or_create_config(db, current_user.id)
+    config.logo_data = None
+    config.logo_hash = None
+    await db.commit()
+    await db.refresh(config)
+    user_cache.invalidate(current_user.id)
     return config
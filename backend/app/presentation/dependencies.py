@@ -1,30 +1,52 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from uuid import UUID
 
 from app.core.config import settings
 from app.infrastructure.database.session import get_db
 from app.infrastructure.database.orm_models.user import UserORM
 from app.application.schemas.token import TokenPayload
+from app.application.services import user_cache, token_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login/access-token")
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> UserORM:
+def _verify_token(token: str) -> UUID:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         token_data = TokenPayload(**payload)
-    except JWTError:
+        user_id = UUID(token_data.sub)
+    except (JWTError, ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = db.query(UserORM).filter(UserORM.id == token_data.sub).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    # jwt.decode has already rejected expired tokens; tokens without exp aren't cached
+    if isinstance(payload.get("exp"), (int, float)):
+        token_cache.put(token, user_id, payload["exp"])
+    return user_id
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> UserORM:
+    user_id = token_cache.get(token)
+    if user_id is None:
+        user_id = _verify_token(token)
+    user = user_cache.get(user_id)
+    if user is None:
+        user = (await db.execute(select(UserORM).options(
+            joinedload(UserORM.business_config)
+        ).where(UserORM.id == user_id))).scalars().first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        # Detach it (and its config) so a rollback in this request can't expire the shared copy
+        db.expunge(user)
+        user_cache.put(user)
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
     return user
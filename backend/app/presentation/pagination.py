@@ -0,0 +1,43 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Opaque cursor pointing just past the given (created_at, id) position."""
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(row_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["c"]), UUID(data["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def keyset_paginate(
+    db: AsyncSession, stmt: Select, model, cursor: Optional[str], limit: int, response: Response
+) -> list:
+    """
+    Returns one page of `stmt`, newest first, ordered by (created_at, id).
+    Each page is an index range scan regardless of depth; when more rows exist
+    the cursor for the next page is sent in the X-Next-Cursor header.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).scalars().all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows
@@ -0,0 +1,32 @@
+from typing import AsyncIterator, Callable, Iterator, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.session import SessionLocal, AsyncSessionLocal
+
+def stream_with_own_session(
+    gen_factory: Callable[[Union[AsyncSession, Session]], Union[AsyncIterator[bytes], Iterator[bytes]]],
+    sync: bool = False
+) -> Union[AsyncIterator[bytes], Iterator[bytes]]:
+    """
+    StreamingResponse body that runs gen_factory(db) on a session of its own, closed
+    when the body ends. The request-scoped session from get_db is already closed by
+    the time a streamed body runs, so bodies can't use it.
+    With sync=True the factory gets a sync Session and returns a plain iterator,
+    which StreamingResponse drains in the threadpool.
+    """
+    if sync:
+        def body():
+            db = SessionLocal()
+            try:
+                yield from gen_factory(db)
+            finally:
+                db.close()
+        return body()
+
+    async def async_body():
+        async with AsyncSessionLocal() as db:
+            async for chunk in gen_factory(db):
+                yield chunk
+    return async_body()
@@ -0,0 +1,73 @@
+import os
+import statistics
+import sys
+import time
+
+# Add the parent directory to the path so we can import 'app'
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from jinja2 import Environment, FileSystemLoader
+
+from app.application.services import pdf_service
+
+ORDER = {
+    "id": "3f2a9c1e",
+    "date": "2024-03-01",
+    "status": "PENDING",
+    "payment_method": "Transferencia",
+    "notes": "Entregar en la tarde",
+    "total_tax": 12.4,
+    "total_commission": 6.2,
+    "total_amount": 173.6,
+    "items": [
+        {"name": f"Producto {n}", "quantity": n % 3 + 1, "base_price": 19.9, "final_price": 21.7}
+        for n in range(8)
+    ],
+}
+BUSINESS = {"business_name": "Mi Shopper", "logo_url": None, "contact_email": "hola@shopper.com", "base_currency": "USD"}
+CLIENT = {"name": "Ana", "last_name": "Ruiz", "email": "ana@example.com", "address": "Av. Siempre Viva 742"}
+
+def render_uncached(order_data: dict, business_data: dict, client_data: dict) -> bytes:
+    """A render that rebuilds everything, as generate_order_pdf did before resources were reused."""
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    env = Environment(loader=FileSystemLoader(pdf_service.TEMPLATE_DIR))
+    html_out = env.get_template(pdf_service.INVOICE_TEMPLATE).render(
+        order=order_data, business=business_data, client=client_data
+    )
+    font_config = FontConfiguration()
+    stylesheet = CSS(filename=pdf_service.INVOICE_STYLESHEET, font_config=font_config)
+    return HTML(string=html_out).write_pdf(stylesheets=[stylesheet], font_config=font_config)
+
+def _report(label: str, timings: list) -> None:
+    timings = sorted(timings)
+    print(
+        f"{label:>9}: median {statistics.median(timings):7.1f} ms   "
+        f"p95 {timings[max(int(len(timings) * 0.95) - 1, 0)]:7.1f} ms   min {timings[0]:7.1f} ms"
+    )
+
+def _time(render, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render(ORDER, BUSINESS, CLIENT)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def benchmark(runs: int = 30):
+    """
+    Per-invoice render time with every resource rebuilt vs with the reused
+    template, stylesheet and fonts of pdf_service.generate_order_pdf.
+    Usage: python bench_pdf_render.py [runs]
+    """
+    print(f"=== Rendering a sample invoice {runs} times per mode ===")
+    # The first render of each mode pays one-off costs (imports, font discovery)
+    render_uncached(ORDER, BUSINESS, CLIENT)
+    pdf_service.generate_order_pdf(ORDER, BUSINESS, CLIENT)
+
+    for label, render in (("uncached", render_uncached), ("reused", pdf_service.generate_order_pdf)):
+        _report(label, _time(render, runs))
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,84 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+# Everything runs in fresh interpreters started from here, so 'app' is importable
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_SNIPPET = (
+    "import sys, time; start = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - start, 'weasyprint' in sys.modules)"
+)
+FIRST_REQUEST_TIMEOUT_SECONDS = 60
+
+def _python(*args: str, **kwargs) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=BACKEND_DIR, capture_output=True, text=True, check=True, **kwargs)
+
+def _import_time() -> tuple:
+    """Seconds to import app.main in a fresh interpreter, and whether WeasyPrint got loaded."""
+    seconds, weasyprint_loaded = _python("-c", IMPORT_SNIPPET).stdout.split()
+    return float(seconds), weasyprint_loaded == "True"
+
+def _slowest_packages(top: int) -> list:
+    """Packages by cumulative import time (including their dependencies), from python -X importtime."""
+    report = _python("-X", "importtime", "-c", "import app.main").stderr
+    packages = []
+    for line in report.splitlines():
+        parts = line.split("|")
+        # A package's root module is imported once, wherever it's first needed
+        if len(parts) == 3 and parts[1].strip().isdigit() and "." not in parts[2].strip():
+            packages.append((int(parts[1]), parts[2].strip()))
+    return sorted(packages, reverse=True)[:top]
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _time_to_first_request() -> float:
+    """Seconds from launching uvicorn until GET /health answers."""
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR
+    )
+    try:
+        while time.perf_counter() - start < FIRST_REQUEST_TIMEOUT_SECONDS:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1):
+                    return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError("The server did not answer in time")
+    finally:
+        server.terminate()
+        server.wait()
+
+def benchmark(runs: int = 5):
+    """
+    Startup cost of an API worker: import time of app.main in a fresh interpreter,
+    the slowest packages to import, and time to first request under uvicorn.
+    No database connection is needed; the schema is managed by Alembic.
+    Usage: python bench_startup.py [runs]
+    """
+    print(f"=== Measuring startup over {runs} runs ===")
+    imports = [_import_time() for _ in range(runs)]
+    print(f"import app.main: median {statistics.median(s for s, _ in imports) * 1000:7.1f} ms")
+    print(f"WeasyPrint loaded at import: {'yes' if any(loaded for _, loaded in imports) else 'no'}")
+
+    print("Slowest packages to import (cumulative):")
+    for micros, package in _slowest_packages(10):
+        print(f"  {micros / 1000:7.1f} ms  {package}")
+
+    first_requests = [_time_to_first_request() for _ in range(runs)]
+    print(f"time to first request: median {statistics.median(first_requests) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,32 @@
+import asyncio
+import os
+import sys
+import uuid
+
+# Add the parent directory to the path so we can import 'app'
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.infrastructure.database.session import AsyncSessionLocal
+from app.application.services.metrics_service import rebuild_monthly_metrics
+from app.application.services.client_stats_service import rebuild_client_stats
+
+async def rebuild(user_id: str = None):
+    """
+    Recomputes the dashboard monthly rollups and client lifetime stats from the orders table.
+    Usage: python rebuild_metrics.py [user_id]
+    """
+    target = uuid.UUID(user_id) if user_id else None
+    print(f"=== Rebuilding monthly metrics and client stats for {'user ' + user_id if target else 'all users'} ===")
+
+    async with AsyncSessionLocal() as db:
+        try:
+            rows = await rebuild_monthly_metrics(db, user_id=target)
+            clients = await rebuild_client_stats(db, user_id=target)
+            await db.commit()
+            print(f"✅ Success! {rows} monthly rollup rows written, {clients} clients reconciled.")
+        except Exception as e:
+            print(f"❌ Error rebuilding metrics: {e}")
+            await db.rollback()
+
+if __name__ == "__main__":
+    asyncio.run(rebuild(sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,54 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.metrics_service import rebuild_monthly_metrics
+from app.infrastructure.database.orm_models.monthly_metrics import MonthlyMetricsORM
+from app.infrastructure.database.orm_models.user import UserORM
+
+ITEM = {"name": "Shoes", "base_price": 10, "tax_percent": 8, "commission_percent": 2.5, "quantity": 2}
+COLUMNS = [
+    "year", "month", "total_revenue", "total_profit", "total_tax", "total_commission", "order_count",
+    "pending_count", "purchased_count", "shipped_count", "delivered_count", "cancelled_count",
+]
+
+
+def _rollups(engine, user_id, rebuild=False):
+    """Non-empty rollup rows of a tenant, optionally recomputed from its orders first."""
+    async def query():
+        async with AsyncSession(engine) as db:
+            if rebuild:
+                await rebuild_monthly_metrics(db, user_id=user_id)
+            rows = (await db.execute(select(MonthlyMetricsORM).where(
+                MonthlyMetricsORM.user_id == user_id
+            ))).scalars().all()
+            snapshot = sorted(tuple(getattr(row, name) for name in COLUMNS) for row in rows if row.order_count)
+            await db.rollback()
+            return snapshot
+    return asyncio.run(query())
+
+
+def test_deleting_a_client_takes_its_orders_out_of_the_rollups(client, db_engine, current_user):
+    async def add_user():
+        async with AsyncSession(db_engine) as db:
+            db.add(UserORM(id=current_user.id, email="shoper@example.com", hashed_password="x", is_active=True))
+            await db.commit()
+    asyncio.run(add_user())
+
+    leaving, staying = [
+        client.post("/api/v1/clients/", json={"name": name, "last_name": "Ruiz"}).json()["id"]
+        for name in ("Ana", "Eva")
+    ]
+    for client_id, day in ((leaving, "2024-01-15"), (leaving, "2024-02-03"), (staying, "2024-02-20")):
+        response = client.post("/api/v1/orders/", json={"client_id": client_id, "date": day, "items": [ITEM]})
+        assert response.status_code == 201
+    cancelled = client.post("/api/v1/orders/", json={"client_id": leaving, "date": "2024-02-05", "items": [ITEM]}).json()
+    client.patch(f"/api/v1/orders/{cancelled['id']}/status", json={"status": "CANCELLED"})
+
+    assert client.delete(f"/api/v1/clients/{leaving}").status_code == 204
+
+    remaining = _rollups(db_engine, current_user.id)
+    # Only the other client's February order is left
+    assert [(row[0], row[1], row[COLUMNS.index("order_count")]) for row in remaining] == [(2024, 2, 1)]
+    assert remaining == _rollups(db_engine, current_user.id, rebuild=True)
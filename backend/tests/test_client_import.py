@@ -0,0 +1,57 @@
+import asyncio
+import io
+import json
+import tempfile
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.client_import_service import RowError, iter_rows
+from app.infrastructure.database.orm_models.user import UserORM
+
+
+def _upload(data: bytes):
+    # Starlette spools uploads into a SpooledTemporaryFile
+    file = tempfile.SpooledTemporaryFile()
+    file.write(data)
+    file.seek(0)
+    return file
+
+
+def test_ndjson_rows_may_contain_unicode_line_separators():
+    lines = [
+        json.dumps({"name": "Ana María", "last_name": "Ruiz\u2028\x1c\x85"}, ensure_ascii=False),
+        json.dumps({"name": "Eva", "last_name": "Sanz"}),
+    ]
+    rows = list(iter_rows(_upload("\n".join(lines).encode()), "ndjson"))
+    assert rows == [
+        (1, {"name": "Ana María", "last_name": "Ruiz\u2028\x1c\x85"}),
+        (2, {"name": "Eva", "last_name": "Sanz"}),
+    ]
+
+
+def test_csv_line_numbers_count_only_real_line_breaks():
+    data = "\ufeffname,last_name\r\n\"Ana\u2028María\",Ruiz\x85\r\nEva,Sanz\r\n".encode()
+    assert [row_num for row_num, _ in iter_rows(_upload(data), "csv")] == [2, 3]
+
+
+def test_malformed_ndjson_lines_are_row_errors():
+    data = b'{"name": "Ana", "last_name": "Ruiz"}\n{"name": "Eva",\n[1, 2]\n'
+    rows = list(iter_rows(_upload(data), "ndjson"))
+    assert rows[0] == (1, {"name": "Ana", "last_name": "Ruiz"})
+    assert [(row_num, type(fields)) for row_num, fields in rows[1:]] == [(2, RowError), (3, RowError)]
+
+
+def test_import_counts_malformed_lines_as_failed(client, db_engine, current_user):
+    async def add_user():
+        async with AsyncSession(db_engine) as db:
+            db.add(UserORM(id=current_user.id, email="shoper@example.com", hashed_password="x", is_active=True))
+            await db.commit()
+    asyncio.run(add_user())
+
+    data = b'{"name": "Ana", "last_name": "Ruiz"}\n{"name": "Eva",\n{"name": "Luz"}\n{"name": "Eva", "last_name": "Sanz"}\n'
+    response = client.post("/api/v1/clients/import", files={"file": ("clients.ndjson", io.BytesIO(data))})
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert (summary["inserted"], summary["skipped"], summary["failed"]) == (2, 0, 2)
+    assert [error["row"] for error in summary["errors"]] == [2, 3]
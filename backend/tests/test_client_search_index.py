@@ -0,0 +1,34 @@
+import importlib.util
+import os
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.infrastructure.database.orm_models.base import Base
+from app.infrastructure.database.orm_models.client import ClientORM
+
+MIGRATION = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "alembic", "versions", "001645ca9c91_performance_indexes.py"
+)
+
+
+def _search_index():
+    [index] = [index for index in ClientORM.__table__.indexes if index.name == "ix_clients_search_trgm"]
+    return index
+
+
+def test_search_index_is_part_of_the_schema():
+    assert _search_index() in Base.metadata.tables["clients"].indexes
+
+
+def test_search_index_matches_its_migration():
+    spec = importlib.util.spec_from_file_location("performance_indexes", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    ddl = str(CreateIndex(_search_index()).compile(dialect=postgresql.dialect()))
+    assert ddl == f"CREATE INDEX ix_clients_search_trgm ON clients USING gin ({migration.CLIENT_SEARCH_DOCUMENT} gin_trgm_ops)"
+
+
+def test_search_terms_shorter_than_a_trigram_are_rejected(client):
+    assert client.get("/api/v1/clients/search", params={"q": "an"}).status_code == 422
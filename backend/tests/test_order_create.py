@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.client import ClientORM
+from app.infrastructure.database.orm_models.monthly_metrics import MonthlyMetricsORM
+from app.infrastructure.database.orm_models.user import UserORM
+
+ITEM = {"name": "Shoes", "base_price": 10, "tax_percent": 8, "commission_percent": 2.5, "quantity": 2}
+
+
+@pytest.fixture
+def client_id(db_engine, current_user):
+    async def seed():
+        async with AsyncSession(db_engine) as db:
+            db.add(UserORM(id=current_user.id, email="shoper@example.com", hashed_password="x", is_active=True))
+            client = ClientORM(user_id=current_user.id, name="Ana", last_name="Ruiz")
+            db.add(client)
+            await db.flush()
+            client_id = client.id
+            await db.commit()
+            return client_id
+    return asyncio.run(seed())
+
+
+def _monthly_order_count(engine, user_id, day):
+    async def query():
+        async with AsyncSession(engine) as db:
+            return (await db.execute(select(MonthlyMetricsORM.order_count).where(
+                MonthlyMetricsORM.user_id == user_id,
+                MonthlyMetricsORM.year == day.year,
+                MonthlyMetricsORM.month == day.month
+            ))).scalar()
+    return asyncio.run(query())
+
+
+def test_orders_without_a_date_are_dated_today(client, db_engine, current_user, client_id):
+    today = datetime.utcnow().date()
+
+    single = client.post("/api/v1/orders/", json={"client_id": str(client_id), "items": [ITEM]})
+    batch = client.post("/api/v1/orders/batch", json={"orders": [{"client_id": str(client_id), "items": [ITEM]}]})
+
+    assert single.status_code == 201
+    assert single.json()["date"] == today.isoformat()
+    assert batch.status_code == 200 and len(batch.json()["created"]) == 1
+    # Both orders count towards this month's dashboard rollup
+    assert _monthly_order_count(db_engine, current_user.id, today) == 2
+
+
+def test_batch_reports_out_of_range_amounts_per_order(client, client_id):
+    def order(base_price):
+        return f'{{"client_id": "{client_id}", "items": [{{"name": "Bag", "base_price": {base_price}}}]}}'
+
+    # Plain JSON can't carry Infinity/NaN, but Python's parser (and so the API) accepts them
+    body = '{"orders": [%s]}' % ", ".join(order(p) for p in ("10", "99999999.995", "Infinity", "NaN", "1e30"))
+    response = client.post("/api/v1/orders/batch", content=body, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert [created["index"] for created in result["created"]] == [0]
+    assert [error["index"] for error in result["errors"]] == [1, 2, 3, 4]
+    assert {error["detail"] for error in result["errors"]} == {"Order amounts are out of range"}
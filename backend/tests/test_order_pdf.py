@@ -0,0 +1,32 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services import pdf_service
+from app.infrastructure.database.orm_models.user import UserORM
+
+ITEM = {"name": "Shoes", "base_price": 10, "quantity": 1}
+
+
+@pytest.fixture
+def order_id(client, db_engine, current_user):
+    async def add_user():
+        async with AsyncSession(db_engine) as db:
+            db.add(UserORM(id=current_user.id, email="shoper@example.com", hashed_password="x", is_active=True))
+            await db.commit()
+    asyncio.run(add_user())
+    client_id = client.post("/api/v1/clients/", json={"name": "Ana", "last_name": "Ruiz"}).json()["id"]
+    return client.post("/api/v1/orders/", json={"client_id": client_id, "items": [ITEM]}).json()["id"]
+
+
+@pytest.mark.parametrize("error", [pdf_service.PdfRendererBusy(), BrokenProcessPool("worker died")])
+def test_unavailable_renderer_returns_503(client, order_id, monkeypatch, error):
+    async def failing_render(order_data, business_data, client_data):
+        raise error
+
+    monkeypatch.setattr(pdf_service, "render_order_pdf", failing_render)
+    response = client.get(f"/api/v1/orders/{order_id}/pdf")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
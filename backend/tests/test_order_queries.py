@@ -0,0 +1,64 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.orm_models.client import ClientORM
+from app.infrastructure.database.orm_models.order import OrderORM
+from app.infrastructure.database.orm_models.order_item import OrderItemORM
+from app.infrastructure.database.orm_models.user import UserORM
+
+ORDER_COUNT = 60
+ITEMS_PER_ORDER = 3
+
+
+async def _seed(engine, user_id):
+    async with AsyncSession(engine) as db:
+        db.add(UserORM(id=user_id, email="shoper@example.com", hashed_password="x", is_active=True))
+        client = ClientORM(user_id=user_id, name="Ana", last_name="Ruiz")
+        db.add(client)
+        await db.flush()
+        for n in range(ORDER_COUNT):
+            db.add(OrderORM(
+                user_id=user_id, client_id=client.id, date=date(2024, 3, 1),
+                total_tax=Decimal("1.00"), total_commission=Decimal("1.00"),
+                total_profit=Decimal("2.00"), total_amount=Decimal("10.00"),
+                items=[
+                    OrderItemORM(
+                        name=f"item {n}.{i}", base_price=Decimal("3.00"), tax_percent=Decimal("0"),
+                        commission_percent=Decimal("0"), quantity=1, tax_amount=Decimal("0"),
+                        commission_amount=Decimal("0"), final_price=Decimal("3.00"), profit_amount=Decimal("0")
+                    )
+                    for i in range(ITEMS_PER_ORDER)
+                ],
+            ))
+        await db.commit()
+
+
+def _statements_per_request(client, engine, **params):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        response = client.get("/api/v1/orders/", params=params)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    assert response.status_code == 200
+    return response.json(), statements
+
+
+def test_order_listing_statement_count_does_not_grow_with_page_size(client, db_engine, current_user):
+    asyncio.run(_seed(db_engine, current_user.id))
+
+    small_page, small_statements = _statements_per_request(client, db_engine, limit=5)
+    large_page, large_statements = _statements_per_request(client, db_engine, limit=50)
+
+    assert len(small_page) == 5 and len(large_page) == 50
+    assert all(len(order["items"]) == ITEMS_PER_ORDER for order in large_page)
+    # One query for the page, one batched SELECT ... IN for its items
+    assert len(large_statements) == len(small_statements) == 2
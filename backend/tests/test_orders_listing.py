@@ -0,0 +1,76 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app.infrastructure.database.orm_models.order import OrderORM, OrderStatus
+from app.infrastructure.database.orm_models.order_item import OrderItemORM
+from app.presentation.api_v1 import orders
+
+FULL_FIELDS = {
+    "id", "client_id", "user_id", "status", "date", "payment_bank", "payment_method", "notes",
+    "total_tax", "total_commission", "total_profit", "total_amount", "created_at", "items",
+}
+SUMMARY_FIELDS = {
+    "id", "client_id", "status", "date", "payment_method", "total_amount", "total_profit", "created_at",
+}
+
+
+@pytest.fixture
+def page(monkeypatch, current_user):
+    """Serves one order with two items as the listing page, without a database."""
+    order_id = uuid.uuid4()
+    order = OrderORM(
+        id=order_id, client_id=uuid.uuid4(), user_id=current_user.id, status=OrderStatus.PENDING,
+        payment_bank="Banco", payment_method="transfer", date=date(2024, 3, 1), notes="rush",
+        total_tax=Decimal("1.60"), total_commission=Decimal("0.50"), total_profit=Decimal("2.10"),
+        total_amount=Decimal("22.10"), created_at=datetime.utcnow(),
+        items=[
+            OrderItemORM(
+                id=uuid.uuid4(), order_id=order_id, name=name, base_price=Decimal("10.00"),
+                tax_percent=Decimal("8.00"), commission_percent=Decimal("2.50"), quantity=1,
+                tax_amount=Decimal("0.80"), commission_amount=Decimal("0.25"),
+                final_price=Decimal("11.05"), profit_amount=Decimal("1.05")
+            )
+            for name in ("Shoes", "Bag")
+        ],
+    )
+
+    async def fake_paginate(db, stmt, model, cursor, limit, response):
+        return [order]
+
+    monkeypatch.setattr(orders, "keyset_paginate", fake_paginate)
+    return order
+
+
+def test_full_view_includes_items(client, page):
+    response = client.get("/api/v1/orders/")
+    assert response.status_code == 200
+    [body] = response.json()
+    assert set(body) == FULL_FIELDS
+    assert [item["name"] for item in body["items"]] == ["Shoes", "Bag"]
+    assert body["date"] == "2024-03-01"
+    assert body["total_tax"] == 1.6 and body["notes"] == "rush"
+
+
+def test_summary_view_has_only_table_columns(client, page):
+    response = client.get("/api/v1/orders/", params={"view": "summary"})
+    assert response.status_code == 200
+    [body] = response.json()
+    assert set(body) == SUMMARY_FIELDS
+
+
+def test_status_query_parameter_filters_the_listing(client, monkeypatch):
+    statements = []
+
+    async def fake_paginate(db, stmt, model, cursor, limit, response):
+        statements.append(stmt)
+        return []
+
+    monkeypatch.setattr(orders, "keyset_paginate", fake_paginate)
+
+    assert client.get("/api/v1/orders/", params={"status": "SHIPPED"}).status_code == 200
+    [stmt] = statements
+    assert OrderStatus.SHIPPED in stmt.compile().params.values()
+    assert client.get("/api/v1/orders/", params={"status": "LOST"}).status_code == 422
@@ -0,0 +1,10 @@
+import pytest
+
+from app.presentation.pagination import MAX_PAGE_SIZE
+
+
+@pytest.mark.parametrize("path", ["/api/v1/orders/", "/api/v1/clients/"])
+@pytest.mark.parametrize("limit", [0, -1, MAX_PAGE_SIZE + 1])
+def test_listing_rejects_out_of_range_limit(client, path, limit):
+    response = client.get(path, params={"limit": limit})
+    assert response.status_code == 422
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from app.application.services import pdf_cache
+from app.core.config import settings
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PDF_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PDF_CACHE_MAX_BYTES", 10_000)
+    monkeypatch.setattr(pdf_cache, "_estimated_bytes", None)
+    return tmp_path
+
+
+def test_directory_is_scanned_only_when_the_limit_is_crossed(cache_dir, monkeypatch):
+    scans = []
+    evict = pdf_cache._evict
+    monkeypatch.setattr(pdf_cache, "_evict", lambda: scans.append(1) or evict())
+
+    for n in range(500):
+        pdf_cache.put(f"{n:064x}", b"x" * 100)
+
+    # One scan to learn the starting size, then one per ~10% of the limit written
+    # (about 40 here), instead of one per put
+    assert len(scans) <= 50
+    assert sum(f.stat().st_size for f in cache_dir.iterdir()) <= settings.PDF_CACHE_MAX_BYTES
+
+
+def test_least_recently_used_pdfs_are_evicted_first(cache_dir):
+    for n in range(10):
+        pdf_cache.put(f"{n:064x}", b"x" * 1000)
+        os.utime(pdf_cache._path(f"{n:064x}"), (n, n))
+    pdf_cache.get(f"{0:064x}") # touching makes it the most recently used
+
+    pdf_cache.put(f"{10:064x}", b"x" * 1000)
+
+    assert pdf_cache.get(f"{0:064x}") is not None
+    assert pdf_cache.get(f"{1:064x}") is None
+    assert pdf_cache.get(f"{10:064x}") is not None
@@ -0,0 +1,29 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.infrastructure.database.session import PoolMetrics
+
+
+def _pool(size: int, max_overflow: int) -> QueuePool:
+    return QueuePool(lambda: sqlite3.connect(":memory:"), pool_size=size, max_overflow=max_overflow)
+
+
+def test_utilization_is_measured_against_size_plus_overflow(monkeypatch):
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 3)
+    pool = _pool(1, 3)
+    connection = pool.connect()
+    try:
+        assert PoolMetrics().snapshot(pool)["utilization"] == 0.25
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("size, max_overflow", [(0, 0), (5, -1)])
+def test_utilization_is_omitted_without_a_bounded_capacity(monkeypatch, size, max_overflow):
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", max_overflow)
+    stats = PoolMetrics().snapshot(_pool(size, max_overflow))
+    assert "utilization" not in stats
+    assert stats["max_overflow"] == max_overflow
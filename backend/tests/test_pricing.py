@@ -0,0 +1,23 @@
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from app.application.schemas.order import OrderItemCreate
+from app.application.services import pricing
+
+
+def test_inputs_are_priced_as_stored():
+    line = pricing.price_line(OrderItemCreate(name="Bag", base_price=99999999.995, tax_percent=8.005))
+    assert line["base_price"] == Decimal("100000000.00")
+    assert line["tax_percent"] == Decimal("8.01")
+
+
+@pytest.mark.parametrize("base_price", [float("inf"), float("-inf"), float("nan")])
+def test_non_finite_prices_are_rejected(base_price):
+    with pytest.raises(ValueError):
+        pricing.price_line(OrderItemCreate(name="Bag", base_price=base_price))
+
+
+def test_prices_too_large_to_round_are_rejected():
+    with pytest.raises(InvalidOperation):
+        pricing.price_line(OrderItemCreate(name="Bag", base_price=1e30))
@@ -0,0 +1,43 @@
+import asyncio
+
+from app.presentation import streaming
+
+
+class FakeSession:
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+def test_sync_body_closes_its_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(streaming, "SessionLocal", lambda: session)
+
+    body = streaming.stream_with_own_session(lambda db: iter([b"a", b"b"]), sync=True)
+
+    assert not session.closed
+    assert list(body) == [b"a", b"b"]
+    assert session.closed
+
+
+def test_async_body_closes_its_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(streaming, "AsyncSessionLocal", lambda: session)
+
+    async def chunks(db):
+        assert db is session and not session.closed
+        yield b"a"
+        yield b"b"
+
+    async def drain(body):
+        return [chunk async for chunk in body]
+
+    assert asyncio.run(drain(streaming.stream_with_own_session(chunks))) == [b"a", b"b"]
+    assert session.closed
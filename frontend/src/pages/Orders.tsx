@@ -57,7 +57,7 @@ export default function Orders() {
         try {
             setLoading(true);
             const [ordersRes, clientsRes] = await Promise.all([
-                apiClient.get<Order[]>('/orders/'),
+                apiClient.get<Order[]>('/orders/', { params: { view: 'summary' } }),
                 apiClient.get<Client[]>('/clients/')
             ]);
             setOrders(ordersRes.data);